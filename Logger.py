@@ -15,7 +15,13 @@ Description :
             output to the controlling terminal (when available) and a color-free
             record to the specified log file.
         - ANSI escape sequences are removed from the file output using a
-            conservative regex; lines are flushed immediately to keep logs live.
+            conservative regex; output is buffered (64 KiB) and flushed whenever
+            the queue runs empty, so bursts cost one flush while logs stay live.
+        - The log file is rotated by size (`main.log` -> `main.log.1` ...),
+            keeping a bounded number of backups so long runs cannot fill the disk.
+        - `write()` only enqueues the message; a single background thread
+            performs the formatting and I/O, so callers never block on disk or
+            terminal writes. `flush()` waits until queued messages are written.
         - Provides minimal API: `write()`, `flush()` and `close()` so it can be
             used as a drop-in replacement for `sys.stdout`.
 
@@ -25,24 +31,37 @@ Usage:
     sys.stdout = logger # optional: redirect all prints to logger
 
 Notes & TODOs:
-    - Consider adding timestamps, log rotation, and JSON output format.
+    - Consider adding timestamps and JSON output format.
     - The ANSI regex is intentionally simple; adjust if you need broader support.
 
 Dependencies:
     - Python >= 3.8 (no external runtime dependencies required)
+    - atexit, queue, threading (standard library)
 
 Assumptions:
     - The log file will contain cleaned, human-readable text (no ANSI codes).
     - The logger is safe for short-lived scripts and long-running processes.
+    - Pending messages are drained by `close()`, which is registered with atexit.
 """
 
+import atexit  # For draining pending messages at exit
 import os  # For interacting with the filesystem
+import queue  # For handing messages to the writer thread
 import re  # For stripping ANSI escape sequences
 import sys  # For replacing stdout/stderr
+import threading  # For the background writer thread
 
 # Regex Constants:
 ANSI_ESCAPE_REGEX = re.compile(r"\x1B\[[0-9;]*[a-zA-Z]")  # Pattern to remove ANSI colors
 
+# Queue Constants:
+STOP_SENTINEL = object()  # Marker telling the writer thread to exit
+
+# File Constants:
+LOGFILE_BUFFER_SIZE = 1 << 16  # Log file buffer size in bytes (64 KiB)
+LOGFILE_MAX_SIZE = 64 << 20  # Log file size (in characters) that triggers a rotation (64 MiB)
+LOGFILE_BACKUP_COUNT = 4  # Number of rotated log files to keep
+
 # Classes Definitions:
 
 
@@ -57,30 +76,42 @@ class Logger:
 
     :param logfile_path: Path to the log file.
     :param clean: If True, truncate the log file on init; otherwise append.
+    :param max_size: Log file size (in characters) that triggers a rotation (0 disables rotation).
+    :param backup_count: Number of rotated log files to keep.
     """
 
-    def __init__(self, logfile_path, clean=False):
+    def __init__(self, logfile_path, clean=False, max_size=LOGFILE_MAX_SIZE, backup_count=LOGFILE_BACKUP_COUNT):
         """
         Initialize the Logger.
 
         :param self: Instance of the Logger class.
         :param logfile_path: Path to the log file.
         :param clean: If True, truncate the log file on init; otherwise append.
+        :param max_size: Log file size (in characters) that triggers a rotation (0 disables rotation).
+        :param backup_count: Number of rotated log files to keep.
         """
 
         self.logfile_path = logfile_path  # Store log file path
+        self.max_size = max_size  # Store rotation size
+        self.backup_count = backup_count  # Store number of backups
 
         parent = os.path.dirname(logfile_path)  # Ensure log directory exists
         if parent and not os.path.exists(parent):  # Create parent directories if needed
             os.makedirs(parent, exist_ok=True)  # Safe creation
 
         mode = "w" if clean else "a"  # Choose file mode based on 'clean' flag
-        self.logfile = open(logfile_path, mode, encoding="utf-8")  # Open log file
+        self.logfile = open(logfile_path, mode, encoding="utf-8", buffering=LOGFILE_BUFFER_SIZE)  # Open log file once with a large buffer
+        self.logfile_size = 0 if clean else os.path.getsize(logfile_path)  # Current log file size (approximate, in characters)
         self.is_tty = sys.stdout.isatty()  # Verify if stdout is a TTY
 
+        self.queue = queue.Queue()  # Messages waiting to be written
+        self.writer = threading.Thread(target=self.drain, name="LoggerWriter", daemon=True)  # Background writer thread
+        self.writer.start()  # Start writer thread
+        atexit.register(self.close)  # Drain pending messages before interpreter shutdown
+
     def write(self, message):
         """
-        Internal method to write messages to both terminal and log file.
+        Queue a message to be written to both terminal and log file.
 
         :param self: Instance of the Logger class.
         :param message: The message to log.
@@ -89,6 +120,38 @@ class Logger:
         if message is None:  # Ignore None messages
             return  # Early exit
 
+        if self.writer.is_alive():  # Verify if the writer thread is running
+            self.queue.put(message)  # Hand message to the writer thread
+        else:  # Writer already stopped (e.g., after close)
+            self.emit(message)  # Write synchronously
+            self.flush_outputs()  # Flush immediately without a writer thread
+
+    def drain(self):
+        """
+        Writer thread loop: writes queued messages until the stop sentinel arrives.
+
+        :param self: Instance of the Logger class.
+        """
+
+        while True:  # Loop until stopped
+            message = self.queue.get()  # Wait for the next message
+            try:  # Write message
+                if message is STOP_SENTINEL:  # Verify if stop was requested
+                    return  # Exit writer thread
+                self.emit(message)  # Write message to outputs
+                if self.queue.empty():  # Verify if the burst of messages is over
+                    self.flush_outputs()  # Flush buffered output once per burst
+            finally:  # Always mark the message as processed
+                self.queue.task_done()  # Allow flush() to return once drained
+
+    def emit(self, message):
+        """
+        Internal method to write messages to both terminal and log file.
+
+        :param self: Instance of the Logger class.
+        :param message: The message to log.
+        """
+
         out = str(message)  # Convert message to string
         if not out.endswith("\n"):  # Ensure newline termination
             out += "\n"  # Append newline if missing
@@ -96,8 +159,10 @@ class Logger:
         clean_out = ANSI_ESCAPE_REGEX.sub("", out)  # Strip ANSI sequences for log file
 
         try:  # Write to log file
-            self.logfile.write(clean_out)  # Write cleaned message
-            self.logfile.flush()  # Ensure immediate write
+            self.logfile.write(clean_out)  # Write cleaned message (buffered)
+            self.logfile_size += len(clean_out)  # Track log file size
+            if self.max_size and self.logfile_size >= self.max_size:  # Verify if the log file reached its size limit
+                self.rotate()  # Rotate log files
         except Exception:  # Fail silently to avoid breaking user code
             pass  # Silent fail
 
@@ -105,16 +170,49 @@ class Logger:
             if sys.__stdout__ is not None:
                 if self.is_tty:  # Terminal supports colors
                     sys.__stdout__.write(out)  # Write colored message
-                    sys.__stdout__.flush()  # Flush immediately
                 else:  # Terminal does not support colors
                     sys.__stdout__.write(clean_out)  # Write cleaned message
-                    sys.__stdout__.flush()  # Flush immediately
         except Exception:  # Fail silently to avoid breaking user code
             pass  # Silent fail
 
+    def rotate(self):
+        """
+        Rotate the log file: shift backups (.1 -> .2 ...), move the current file to .1 and reopen it empty.
+
+        :param self: Instance of the Logger class.
+        """
+
+        self.logfile.close()  # Close current log file (flushes buffered output)
+
+        mode = "w"  # Start a new log file unless moving the current one fails
+        if self.backup_count > 0:  # Verify if backups should be kept
+            try:  # Shift backups
+                for index in range(self.backup_count - 1, 0, -1):  # Shift existing backups, oldest first
+                    source = f"{self.logfile_path}.{index}"  # Backup to shift
+                    if os.path.exists(source):  # Verify if backup exists
+                        os.replace(source, f"{self.logfile_path}.{index + 1}")  # Shift backup (overwrites the oldest)
+                os.replace(self.logfile_path, f"{self.logfile_path}.1")  # Move current log file to the first backup
+            except OSError:  # Rotation failed (e.g., permissions)
+                mode = "a"  # Keep appending to the current file instead of losing it
+
+        self.logfile = open(self.logfile_path, mode, encoding="utf-8", buffering=LOGFILE_BUFFER_SIZE)  # Reopen the log file
+        self.logfile_size = 0  # Reset tracked size (also delays a retry after a failed rotation)
+
     def flush(self):
         """
-        Flush the log file.
+        Wait for queued messages to be written, then flush the log file.
+
+        :param self: Instance of the Logger class.
+        """
+
+        if self.writer.is_alive() and threading.current_thread() is not self.writer:  # Verify if messages may still be queued
+            self.queue.join()  # Wait until the writer thread drains the queue
+
+        self.flush_outputs()  # Flush buffered output
+
+    def flush_outputs(self):
+        """
+        Flush the log file and terminal buffers.
 
         :param self: Instance of the Logger class.
         """
@@ -124,13 +222,25 @@ class Logger:
         except Exception:  # Fail silently
             pass  # Silent fail
 
+        try:  # Flush terminal buffer
+            if sys.__stdout__ is not None:  # Verify if a terminal stream exists
+                sys.__stdout__.flush()  # Flush terminal
+        except Exception:  # Fail silently
+            pass  # Silent fail
+
     def close(self):
         """
-        Close the log file.
+        Drain pending messages, stop the writer thread and close the log file.
 
         :param self: Instance of the Logger class.
         """
 
+        if self.writer.is_alive():  # Verify if the writer thread is running
+            self.queue.put(STOP_SENTINEL)  # Ask writer thread to exit after pending messages
+            self.writer.join()  # Wait for pending messages to be written
+
+        self.flush_outputs()  # Flush remaining buffered output
+
         try:  # Close log file
             self.logfile.close()  # Close log file
         except Exception:  # Fail silently
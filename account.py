@@ -34,19 +34,69 @@ Outputs:
 TODOs:
     - Implement balance change detection
     - Add support for multiple account management
-    - Cache average price calculations
 
 Dependencies:
     - Python >= 3.8
+    - collections (standard library)
+    - concurrent.futures (standard library)
+    - time (standard library)
     - typing (standard library)
 
 Assumptions & Notes:
     - Uses first available account by default
-    - Average price is calculated from all executed orders
-    - Balances are retrieved fresh on each call
+    - Average price is calculated from all executed buy orders of the pair
+    - The orders endpoint is not paginated (it returns every matching order in one array), so one request per pair is complete
+    - Balances are cached briefly and indexed by symbol after each refresh
+    - Cached balances are invalidated explicitly after order placement
+    - Average prices are cached until the order set signature changes
+    - Parsed order fills are kept in an LRU cache capped at ORDER_FILLS_CACHE_MAX_ENTRIES orders
 """
 
-from typing import Dict, List, Optional  # For type hints
+import time  # For cache timestamps and retry backoff
+from collections import OrderedDict  # For the bounded order fills LRU cache
+from concurrent.futures import ThreadPoolExecutor, as_completed  # For concurrent order fetches
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple  # For type hints
+
+
+# Cache Constants:
+BALANCES_CACHE_TTL = 0.5  # Seconds a fetched balances list is reused before refreshing (the only balances cache, APIClient does not cache them)
+ACCOUNT_ID_RETRY_BACKOFF = 30.0  # Seconds to wait before retrying a failed account lookup
+ORDER_FILLS_CACHE_MAX_ENTRIES = 5000  # Maximum number of orders whose parsed fills are kept, least recently used are evicted first
+
+# Order Constants:
+BUY_SIDE = "buy"  # Order side value for buy orders
+
+# Concurrency Constants:
+AVERAGE_PRICE_MAX_WORKERS = 8  # Maximum concurrent order fetches in calculate_average_prices
+
+
+# Classes Definitions:
+
+
+class Execution(NamedTuple):
+    """
+    Order execution parsed once from the API response.
+    
+    :param price: Execution price
+    :param qty: Executed quantity
+    """
+    
+    price: float  # Execution price
+    qty: float  # Executed quantity
+
+
+class Balances(NamedTuple):
+    """
+    Column view of the account balances, built once per balances refresh.
+    
+    :param symbols: Currency symbols
+    :param avails: Available amounts as returned by the API
+    :param totals: Total amounts as returned by the API
+    """
+    
+    symbols: Tuple[str, ...]  # Currency symbols
+    avails: Tuple[str, ...]  # Available amounts
+    totals: Tuple[str, ...]  # Total amounts
 
 
 class AccountManager:
@@ -56,19 +106,48 @@ class AccountManager:
     :param: None
     :return: None
     """
-
-
-    def __init__(self, api_client):
+    
+    __slots__ = (  # Fixed attribute layout, avoids a per-instance __dict__
+        "api_client",  # API client instance
+        "account_id",  # Selected account ID
+        "account_id_resolved",  # Account lookup cached flag
+        "account_id_retry_at",  # Failed account lookup retry time
+        "accounts_cache",  # Cached accounts list
+        "balances_cache",  # Cached balances list
+        "balances_by_symbol",  # Balances indexed by symbol
+        "available_by_symbol",  # Parsed available amounts by symbol
+        "total_by_symbol",  # Parsed total amounts by symbol
+        "balances_columns",  # Column view of balances
+        "balances_cache_ts",  # Balances refresh timestamp
+        "balances_ttl",  # Balances cache TTL
+        "average_price_cache",  # Average price cache
+        "order_fills_cache",  # Per-order parsed executions cache
+    )
+
+
+    def __init__(self, api_client, balances_ttl: float = BALANCES_CACHE_TTL):
         """
         Initializes the AccountManager.
         
         :param api_client: APIClient instance for API operations
+        :param balances_ttl: Seconds a fetched balances list is reused before refreshing
         :return: None
         """
         
         self.api_client = api_client  # Store API client instance
         self.account_id: Optional[str] = None  # Initialize account ID as None
+        self.account_id_resolved = False  # Whether an account lookup result (including none found) is cached
+        self.account_id_retry_at: float = 0.0  # Monotonic time after which a failed account lookup may be retried
         self.accounts_cache: Optional[List[Dict]] = None  # Cache for accounts list
+        self.balances_cache: Optional[List[Dict]] = None  # Cache for balances list
+        self.balances_by_symbol: Dict[str, Dict] = {}  # Index of cached balances keyed by symbol
+        self.available_by_symbol: Dict[str, float] = {}  # Parsed available amounts keyed by symbol
+        self.total_by_symbol: Dict[str, float] = {}  # Parsed total amounts keyed by symbol
+        self.balances_columns: Optional[Balances] = None  # Column view of cached balances
+        self.balances_cache_ts: float = 0.0  # Monotonic timestamp of the last balances refresh
+        self.balances_ttl = balances_ttl  # Store balances cache TTL
+        self.average_price_cache: Dict[Tuple[str, str], Tuple[Tuple, Optional[float]]] = {}  # Average price per (crypto, pair) with order set signature
+        self.order_fills_cache: "OrderedDict[str, Tuple[Any, List[Execution], float, float]]" = OrderedDict()  # LRU of parsed executions and (cost, qty) per order ID with update timestamp
 
 
     def get_accounts(self) -> Optional[List[Dict]]:
@@ -93,14 +172,18 @@ class AccountManager:
         :return: Account ID string or None if no accounts available
         """
         
-        if self.account_id:  # Verify if account ID already set
-            return self.account_id  # Return cached account ID
+        if self.account_id_resolved:  # Verify if a lookup result is already cached
+            if self.account_id or time.monotonic() < self.account_id_retry_at:  # Verify if result is an ID or a still-fresh failure
+                return self.account_id  # Return cached account ID (or cached None)
         
         accounts = self.get_accounts()  # Get accounts list
+        self.account_id_resolved = True  # Cache lookup result, positive or negative
         if accounts and len(accounts) > 0:  # Verify if accounts exist
             self.account_id = accounts[0].get("id")  # Set account ID from first account
-            return self.account_id  # Return account ID
+            if self.account_id:  # Verify if account has an ID
+                return self.account_id  # Return account ID
         
+        self.account_id_retry_at = time.monotonic() + ACCOUNT_ID_RETRY_BACKOFF  # Back off before querying accounts again
         return None  # Return None if no accounts available
 
 
@@ -113,21 +196,73 @@ class AccountManager:
         """
         
         self.account_id = account_id  # Set account ID
+        self.account_id_resolved = True  # Mark account ID as resolved
 
 
     def get_balances(self) -> Optional[List[Dict]]:
         """
-        Retrieves balances for the current account.
+        Retrieves balances for the current account, reusing a recent fetch.
         
         :param: None
         :return: List of balance dictionaries or None if failed
         """
         
+        if self.balances_cache is not None and time.monotonic() - self.balances_cache_ts < self.balances_ttl:  # Verify if cached balances are still fresh
+            return self.balances_cache  # Return cached balances
+        
         account_id = self.get_account_id()  # Get account ID
         if not account_id:  # Verify if account ID is available
             return None  # Return None if no account ID
         
-        return self.api_client.get_balances(account_id)  # Request balances from API
+        balances = self.api_client.get_balances(account_id)  # Request balances from API
+        if balances:  # Verify if balances were retrieved
+            self.balances_cache = balances  # Cache balances list
+            self.balances_by_symbol = {}  # Reset symbol index
+            self.available_by_symbol = {}  # Reset parsed available amounts
+            self.total_by_symbol = {}  # Reset parsed total amounts
+            symbols, avails, totals = [], [], []  # Columns for the balances view
+            for balance in balances:  # Index and parse balances once per refresh
+                symbol = balance.get("symbol")  # Get balance symbol
+                available = balance.get("available", "0")  # Get available amount
+                total = balance.get("total", "0")  # Get total amount
+                self.balances_by_symbol[symbol] = balance  # Index balance by symbol
+                self.available_by_symbol[symbol] = parse_amount(available)  # Parse available amount
+                self.total_by_symbol[symbol] = parse_amount(total)  # Parse total amount
+                symbols.append(symbol if symbol is not None else "N/A")  # Add symbol column value
+                avails.append(available)  # Add available column value
+                totals.append(total)  # Add total column value
+            self.balances_columns = Balances(tuple(symbols), tuple(avails), tuple(totals))  # Freeze column view
+            self.balances_cache_ts = time.monotonic()  # Record refresh timestamp
+        return balances  # Return balances list
+
+
+    def get_balance_columns(self) -> Optional[Balances]:
+        """
+        Retrieves the balances as a column view (symbols, available and total amounts).
+        
+        :param: None
+        :return: Balances named tuple or None if failed
+        """
+        
+        if not self.get_balances():  # Verify if balances retrieved (refreshes the column view when stale)
+            return None  # Return None if no balances
+        return self.balances_columns  # Return column view
+
+
+    def invalidate_balances(self) -> None:
+        """
+        Discards cached balances so the next lookup fetches fresh data.
+        
+        :param: None
+        :return: None
+        """
+        
+        self.balances_cache = None  # Drop cached balances list
+        self.balances_columns = None  # Drop column view
+        self.balances_by_symbol = {}  # Drop symbol index
+        self.available_by_symbol = {}  # Drop parsed available amounts
+        self.total_by_symbol = {}  # Drop parsed total amounts
+        self.balances_cache_ts = 0.0  # Reset refresh timestamp
 
 
     def get_balance(self, symbol: str) -> Optional[Dict]:
@@ -138,15 +273,11 @@ class AccountManager:
         :return: Balance dictionary or None if not found
         """
         
-        balances = self.get_balances()  # Get all balances
+        balances = self.get_balances()  # Get all balances (refreshes the symbol index when stale)
         if not balances:  # Verify if balances retrieved
             return None  # Return None if no balances
         
-        for balance in balances:  # Iterate through balances
-            if balance.get("symbol") == symbol:  # Verify if symbol matches
-                return balance  # Return matching balance
-        
-        return None  # Return None if symbol not found
+        return self.balances_by_symbol.get(symbol)  # Return matching balance or None if symbol not found
 
 
     def get_available_balance(self, symbol: str) -> float:
@@ -157,14 +288,9 @@ class AccountManager:
         :return: Available balance as float, 0.0 if not found
         """
         
-        balance = self.get_balance(symbol)  # Get balance for symbol
-        if balance:  # Verify if balance exists
-            available = balance.get("available", "0")  # Get available amount
-            try:  # Attempt to convert to float
-                return float(available)  # Return available balance as float
-            except ValueError:  # Handle conversion error
-                return 0.0  # Return 0.0 on error
-        return 0.0  # Return 0.0 if balance not found
+        if not self.get_balances():  # Refresh balances and parsed amounts when stale
+            return 0.0  # Return 0.0 if no balances
+        return self.available_by_symbol.get(symbol, 0.0)  # Return parsed available balance, 0.0 if not found
 
 
     def get_total_balance(self, symbol: str) -> float:
@@ -175,14 +301,9 @@ class AccountManager:
         :return: Total balance as float, 0.0 if not found
         """
         
-        balance = self.get_balance(symbol)  # Get balance for symbol
-        if balance:  # Verify if balance exists
-            total = balance.get("total", "0")  # Get total amount
-            try:  # Attempt to convert to float
-                return float(total)  # Return total balance as float
-            except ValueError:  # Handle conversion error
-                return 0.0  # Return 0.0 on error
-        return 0.0  # Return 0.0 if balance not found
+        if not self.get_balances():  # Refresh balances and parsed amounts when stale
+            return 0.0  # Return 0.0 if no balances
+        return self.total_by_symbol.get(symbol, 0.0)  # Return parsed total balance, 0.0 if not found
 
 
     def get_all_orders(self) -> Optional[Dict]:
@@ -200,11 +321,12 @@ class AccountManager:
         return self.api_client.get_all_orders(account_id)  # Request all orders from API
 
 
-    def get_orders_for_symbol(self, symbol: str) -> Optional[List[Dict]]:
+    def get_orders_for_symbol(self, symbol: str, side: Optional[str] = None) -> Optional[List[Dict]]:
         """
         Retrieves orders for a specific symbol.
         
         :param symbol: Trading pair symbol (e.g., BTC-BRL)
+        :param side: Order side filter applied by the API (buy or sell), optional
         :return: List of order dictionaries or None if failed
         """
         
@@ -212,55 +334,133 @@ class AccountManager:
         if not account_id:  # Verify if account ID is available
             return None  # Return None if no account ID
         
-        return self.api_client.get_orders(account_id, symbol)  # Request orders from API
+        return self.api_client.get_orders(account_id, symbol, side=side)  # Request orders from API
+
+
+    def get_orders_signature(self, orders: List[Dict]) -> Tuple[int, int]:
+        """
+        Builds a signature of an order list used to detect changes to any order, not just the last one.
+        
+        :param orders: List of order dictionaries
+        :return: Tuple of (order count, hash over every order's ID, update timestamp and filled quantity)
+        """
+        
+        digest = hash(tuple((order.get("id"), order.get("updated_at"), order.get("filledQty")) for order in orders))  # Digest every order's identity and fill state
+        return (len(orders), digest)  # Return order set signature
+
+
+    def get_order_fills(self, order: Dict) -> Tuple[List[Execution], float, float]:
+        """
+        Parses an order's executions once and caches them alongside their totals in a bounded LRU cache.
+        
+        :param order: Order dictionary containing executions
+        :return: Tuple of (parsed executions, total cost, total quantity)
+        """
+        
+        order_id = order.get("id")  # Get order ID
+        updated_at = order.get("updated_at")  # Get order update timestamp
+        
+        cached = self.order_fills_cache.get(order_id) if order_id is not None else None  # Get cached fills for the order
+        if cached is not None and updated_at is not None and cached[0] == updated_at:  # Verify if order did not change since cached
+            self.order_fills_cache.move_to_end(order_id)  # Mark the order as most recently used
+            return cached[1], cached[2], cached[3]  # Return cached executions and totals
+        
+        executions = [execution for execution in map(parse_execution, order.get("executions", [])) if execution is not None]  # Parse executions, skipping invalid rows
+        order_cost, order_qty = sum_execution_fills(executions)  # Reduce parsed executions to totals
+        
+        if order_id is not None:  # Verify if the order can be cached
+            self.order_fills_cache[order_id] = (updated_at, executions, order_cost, order_qty)  # Cache parsed executions and totals
+            self.order_fills_cache.move_to_end(order_id)  # Mark the order as most recently used
+            while len(self.order_fills_cache) > ORDER_FILLS_CACHE_MAX_ENTRIES:  # Verify if the cache exceeds its bound
+                self.order_fills_cache.popitem(last=False)  # Evict the least recently used order
+        return executions, order_cost, order_qty  # Return parsed executions and totals
+
+
+    def get_order_fill_totals(self, order: Dict) -> Tuple[float, float]:
+        """
+        Returns the executed cost and quantity of an order, reusing previous results.
+        
+        :param order: Order dictionary containing executions
+        :return: Tuple of (total cost, total quantity) for the order executions
+        """
+        
+        _, order_cost, order_qty = self.get_order_fills(order)  # Get cached or freshly parsed fills
+        return order_cost, order_qty  # Return order totals
+
+
+    def average_price_from_orders(self, crypto_symbol: str, trading_pair: str, orders: Optional[List[Dict]]) -> Optional[float]:
+        """
+        Calculates average purchase price from an already fetched order list.
+        
+        :param crypto_symbol: Cryptocurrency symbol (e.g., BTC)
+        :param trading_pair: Trading pair symbol (e.g., BTC-BRL)
+        :param orders: List of order dictionaries for the trading pair
+        :return: Average price as float or None if no executions
+        """
+        
+        if not orders:  # Verify if orders exist
+            return None  # Return None if no orders
+        
+        signature = self.get_orders_signature(orders)  # Summarize the current order set
+        cache_key = (crypto_symbol, trading_pair)  # Average price cache key
+        cached = self.average_price_cache.get(cache_key)  # Get cached average price entry
+        if cached is not None and cached[0] == signature:  # Verify if the order set is unchanged since last calculation
+            return cached[1]  # Return cached average price
+        
+        order_totals = (  # Lazily yield (cost, qty) per buy order, guarding against orders the API filters did not exclude
+            self.get_order_fill_totals(order)
+            for order in orders
+            if order.get("side") == BUY_SIDE and order.get("instrument") == trading_pair
+        )
+        total_cost, total_qty = fold_fill_totals(order_totals)  # Fold order totals in a single streaming pass
+        
+        average_price = total_cost / total_qty if total_qty > 0 else None  # Weighted average price or None if no buy executions
+        self.average_price_cache[cache_key] = (signature, average_price)  # Cache result with the order set signature
+        return average_price  # Return weighted average price
 
 
     def calculate_average_price(self, crypto_symbol: str, trading_pair: str) -> Optional[float]:
         """
         Calculates average purchase price for a cryptocurrency from executions.
+        Relies on the orders endpoint returning every buy order of the pair in a single, unpaginated response.
         
         :param crypto_symbol: Cryptocurrency symbol (e.g., BTC)
         :param trading_pair: Trading pair symbol (e.g., BTC-BRL)
         :return: Average price as float or None if no executions
         """
         
-        all_orders_data = self.get_all_orders()  # Get all orders
-        if not all_orders_data:  # Verify if orders data exists
-            return None  # Return None if no orders data
-        
-        orders = all_orders_data.get("items", [])  # Extract orders list from response
-        
-        total_cost = 0.0  # Initialize total cost accumulator
-        total_qty = 0.0  # Initialize total quantity accumulator
-        
-        for order in orders:  # Iterate through all orders
-            if order.get("instrument") != trading_pair:  # Verify if order is for the trading pair
-                continue  # Skip orders for other pairs
-            
-            if order.get("side") != "buy":  # Verify if order is a buy order
-                continue  # Skip sell orders
-            
-            executions = order.get("executions", [])  # Get executions list
-            
-            for execution in executions:  # Iterate through executions
-                price = execution.get("price")  # Get execution price
-                qty = execution.get("qty")  # Get execution quantity
-                
-                if price is None or qty is None:  # Verify if price and quantity exist
-                    continue  # Skip incomplete executions
-                
-                try:  # Attempt to convert and calculate
-                    exec_price = float(price)  # Convert price to float
-                    exec_qty = float(qty)  # Convert quantity to float
-                    total_cost += exec_price * exec_qty  # Add to total cost
-                    total_qty += exec_qty  # Add to total quantity
-                except (ValueError, TypeError):  # Handle conversion errors
-                    continue  # Skip invalid executions
-        
-        if total_qty > 0:  # Verify if any quantity was accumulated
-            return total_cost / total_qty  # Return weighted average price
-        
-        return None  # Return None if no buy executions found
+        orders = self.get_orders_for_symbol(trading_pair, side=BUY_SIDE)  # Get buy orders for the pair, filtered by the API
+        return self.average_price_from_orders(crypto_symbol, trading_pair, orders)  # Calculate average from orders
+
+
+    def calculate_average_prices(self, pairs: List[Tuple[str, str]]) -> Dict[str, Optional[float]]:
+        """
+        Calculates average purchase prices for several pairs, fetching orders concurrently.
+        
+        :param pairs: List of (crypto symbol, trading pair) tuples
+        :return: Dictionary mapping trading pair to average price (None if unavailable)
+        """
+        
+        averages: Dict[str, Optional[float]] = {pair: None for _, pair in pairs}  # Initialize results
+        
+        account_id = self.get_account_id()  # Get account ID
+        if not account_id or not pairs:  # Verify if account ID and pairs are available
+            return averages  # Return empty results
+        
+        with ThreadPoolExecutor(max_workers=min(AVERAGE_PRICE_MAX_WORKERS, len(pairs))) as executor:  # Fan out network-bound order fetches
+            futures = {  # Map each future to its (crypto, pair) tuple
+                executor.submit(self.api_client.get_orders, account_id, pair, side=BUY_SIDE): (crypto, pair)
+                for crypto, pair in pairs
+            }
+            for future in as_completed(futures):  # Iterate through completed fetches
+                crypto, pair = futures[future]  # Get pair for the future
+                try:  # Attempt to get fetched orders
+                    orders = future.result()  # Get orders list
+                except Exception:  # Handle fetch failures
+                    continue  # Leave average as None
+                averages[pair] = self.average_price_from_orders(crypto, pair, orders)  # Calculate average on the calling thread
+        
+        return averages  # Return average prices
 
 
     def get_positions(self) -> Optional[List[Dict]]:
@@ -278,12 +478,86 @@ class AccountManager:
         return self.api_client.get_positions(account_id)  # Request positions from API
 
 
-def create_account_manager(api_client) -> AccountManager:
+# Functions Definitions:
+
+
+def parse_amount(value) -> float:
+    """
+    Parses a balance amount into a float.
+    
+    :param value: Amount value from the API (string or number)
+    :return: Amount as float, 0.0 if invalid
+    """
+    
+    try:  # Attempt to convert to float
+        return float(value)  # Return amount as float
+    except (ValueError, TypeError):  # Handle conversion errors
+        return 0.0  # Return 0.0 on error
+
+
+def parse_execution(execution: Dict) -> Optional[Execution]:
+    """
+    Parses an execution dictionary into an Execution record.
+    
+    :param execution: Execution dictionary from the API
+    :return: Execution with float price and quantity or None if incomplete or invalid
+    """
+    
+    price = execution.get("price")  # Get execution price
+    qty = execution.get("qty")  # Get execution quantity
+    
+    if price is None or qty is None:  # Verify if price and quantity exist
+        return None  # Skip incomplete executions
+    
+    try:  # Attempt to convert values
+        return Execution(float(price), float(qty))  # Return parsed execution
+    except (ValueError, TypeError):  # Handle conversion errors
+        return None  # Skip invalid executions
+
+
+def sum_execution_fills(executions: Iterable[Execution]) -> Tuple[float, float]:
+    """
+    Reduces parsed executions to their total cost and quantity in a single pass.
+    
+    :param executions: Iterable of Execution records
+    :return: Tuple of (total cost, total quantity)
+    """
+    
+    total_cost = 0.0  # Initialize total cost accumulator
+    total_qty = 0.0  # Initialize total quantity accumulator
+    
+    for execution in executions:  # Iterate through executions
+        total_cost += execution.price * execution.qty  # Add to total cost
+        total_qty += execution.qty  # Add to total quantity
+    
+    return total_cost, total_qty  # Return totals
+
+
+def fold_fill_totals(totals: Iterable[Tuple[float, float]]) -> Tuple[float, float]:
+    """
+    Folds (cost, quantity) pairs into running totals without materializing them.
+    
+    :param totals: Iterable of (cost, quantity) tuples
+    :return: Tuple of (total cost, total quantity)
+    """
+    
+    total_cost = 0.0  # Initialize total cost accumulator
+    total_qty = 0.0  # Initialize total quantity accumulator
+    
+    for cost, qty in totals:  # Consume pairs as they are produced
+        total_cost += cost  # Add to total cost
+        total_qty += qty  # Add to total quantity
+    
+    return total_cost, total_qty  # Return totals
+
+
+def create_account_manager(api_client, balances_ttl: float = BALANCES_CACHE_TTL) -> AccountManager:
     """
     Factory function to create an AccountManager instance.
     
     :param api_client: APIClient instance for API operations
+    :param balances_ttl: Seconds a fetched balances list is reused before refreshing
     :return: Initialized AccountManager instance
     """
     
-    return AccountManager(api_client)  # Create and return AccountManager instance
+    return AccountManager(api_client, balances_ttl)  # Create and return AccountManager instance
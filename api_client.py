@@ -11,10 +11,15 @@ Description :
 
     Key features include:
         - Complete API v4 endpoint coverage
+        - Persistent HTTP session with connection pooling
+        - Concurrent fan-out of independent requests
         - Automatic authentication handling
-        - Request retry logic with exponential backoff
+        - Request retry logic with exponential backoff and jitter
         - Error handling and logging
-        - Rate limiting compliance
+        - Client-side token bucket rate limiting (public and private tiers)
+        - Short-lived GET response caching for tickers and order books
+        - Batched ticker retrieval for all monitored symbols in one request
+        - Optional WebSocket market data stream for tickers and order books
         - Response validation
 
 Usage:
@@ -23,19 +28,23 @@ Usage:
     2. Call endpoint methods to interact with API.
         balances = client.get_balances(account_id)
     3. Handle responses and errors appropriately.
+    4. Call close() when done to release pooled connections.
+        client.close()
 
 Outputs:
     - JSON responses from API endpoints
     - Error messages for failed requests
 
 TODOs:
-    - Implement rate limiting logic
-    - Add request caching for frequently accessed data
-    - Implement WebSocket support for real-time data
+    - Add WebSocket support for private account updates
 
 Dependencies:
     - Python >= 3.8
     - requests
+    - orjson (optional, falls back to the json standard library module)
+    - concurrent.futures (standard library)
+    - random (standard library)
+    - threading (standard library)
     - time (standard library)
     - typing (standard library)
 
@@ -43,23 +52,129 @@ Assumptions & Notes:
     - All requests use JSON format
     - Authentication is handled automatically
     - Endpoints follow Mercado Bitcoin API v4 specification
+    - When a market data stream is attached, get_ticker and get_orderbook only
+      hit REST when the streamed data is missing or stale
 """
 
+import random  # For retry backoff jitter
 import requests  # For HTTP requests
+import threading  # For thread-safe rate limiting
 import time  # For retry delays and timing
-from typing import Any, Dict, List, Optional  # For type hints
+from concurrent.futures import ThreadPoolExecutor  # For concurrent request fan-out
+from requests.adapters import HTTPAdapter  # For connection pool configuration
+from typing import Any, Callable, Dict, List, Optional, Tuple  # For type hints
+
+try:  # Prefer orjson for faster JSON parsing and serialization
+    import orjson  # For fast JSON encoding/decoding
+    json_loads = orjson.loads  # Parse JSON from bytes
+    json_dumps = orjson.dumps  # Serialize JSON to bytes
+except ImportError:  # Fall back to the standard library when orjson is not installed
+    import json  # For JSON encoding/decoding
+    json_loads = json.loads  # Parse JSON from bytes
+
+    def json_dumps(obj: Any) -> bytes:
+        """
+        Serializes an object to JSON bytes using the standard library.
 
+        :param obj: Object to serialize
+        :return: UTF-8 encoded JSON bytes
+        """
 
-class APIClient:  # API client class for Mercado Bitcoin
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")  # Serialize compactly and encode
+
+
+# Concurrency Constants:
+MAX_CONCURRENT_REQUESTS = 8  # Maximum in-flight requests when fanning out independent calls
+
+# Order Constants:
+MARKET_ORDER_BODIES = {  # Pre-serialized market order bodies per (side, size field), only the size value is filled in
+    ("buy", "cost"): b'{"side":"buy","type":"market","cost":"%s"}',  # Market buy by cost
+    ("buy", "qty"): b'{"side":"buy","type":"market","qty":"%s"}',  # Market buy by quantity
+    ("sell", "cost"): b'{"side":"sell","type":"market","cost":"%s"}',  # Market sell by cost
+    ("sell", "qty"): b'{"side":"sell","type":"market","qty":"%s"}',  # Market sell by quantity
+}
+
+# Cache Constants:
+CACHE_TTLS = {  # Seconds a GET response is reused, per endpoint kind
+    "ticker": 2.0,  # Single ticker
+    "tickers": 2.0,  # All tickers
+    "orderbook": 1.0,  # Order book
+}  # Balances are not cached here, AccountManager caches them (BALANCES_CACHE_TTL) and invalidates them after orders
+
+
+class TokenBucket:  # Client-side rate limiter
     """
-    Client for Mercado Bitcoin API v4.
+    Token bucket rate limiter that blocks until a request token is available.
     
     :param: None
     :return: None
     """
 
 
-    def __init__(self, authenticator, base_url: str, timeout: int = 30, max_retries: int = 3, retry_delay: int = 2):
+    def __init__(self, capacity: float, refill_rate: float):
+        """
+        Initializes the token bucket full.
+        
+        :param capacity: Maximum number of tokens (burst size)
+        :param refill_rate: Tokens added per second (sustained requests per second)
+        :return: None
+        """
+        
+        self.capacity = capacity  # Store bucket capacity
+        self.refill_rate = refill_rate  # Store refill rate
+        self.tokens = capacity  # Start with a full bucket
+        self.last_refill = time.monotonic()  # Timestamp of the last refill
+        self.lock = threading.Lock()  # Lock for concurrent consumers
+
+
+    def consume(self) -> None:
+        """
+        Takes one token from the bucket, sleeping until one is available.
+        
+        :param: None
+        :return: None
+        """
+        
+        while True:  # Loop until a token is taken
+            with self.lock:  # Serialize bucket updates
+                now = time.monotonic()  # Get current time
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)  # Refill tokens for elapsed time
+                self.last_refill = now  # Update refill timestamp
+                if self.tokens >= 1:  # Verify if a token is available
+                    self.tokens -= 1  # Take a token
+                    return  # Token acquired
+                wait = (1 - self.tokens) / self.refill_rate  # Time until the next token is available
+            time.sleep(wait)  # Wait outside the lock
+
+
+class APIClient:  # API client class for Mercado Bitcoin
+    """
+    Client for Mercado Bitcoin API v4.
+    
+    :param: None
+    :return: None
+    """
+    
+    __slots__ = (  # Fixed attribute layout, avoids a per-instance __dict__
+        "authenticator",  # Authenticator instance
+        "base_url",  # Base URL
+        "timeout",  # Request timeout
+        "max_retries",  # Maximum retry attempts
+        "retry_delay",  # Base retry delay
+        "max_retry_after",  # Longest honored Retry-After wait
+        "session",  # Pooled HTTP session
+        "executor",  # Concurrent request worker pool
+        "public_bucket",  # Public endpoints rate limiter
+        "private_bucket",  # Authenticated endpoints rate limiter
+        "response_cache",  # Cached GET responses
+        "ticker_symbols",  # Batched ticker symbols
+        "orderbook_urls",  # Prebuilt order book URLs
+        "market_stream",  # WebSocket market data stream
+        "stream_max_age",  # Streamed data staleness limit
+    )
+
+
+    def __init__(self, authenticator, base_url: str, timeout: int = 30, max_retries: int = 3, retry_delay: int = 2, pool_connections: int = 20, pool_maxsize: int = 40, public_rate_limit: Tuple[float, float] = (6, 3), private_rate_limit: Tuple[float, float] = (10, 5), preload_symbols: Optional[List[str]] = None, max_retry_after: float = 30.0):
         """
         Initializes the API client.
         
@@ -68,6 +183,12 @@ class APIClient:  # API client class for Mercado Bitcoin
         :param timeout: Request timeout in seconds
         :param max_retries: Maximum number of retry attempts
         :param retry_delay: Delay between retries in seconds
+        :param pool_connections: Number of host connection pools to keep
+        :param pool_maxsize: Maximum keep-alive connections per host pool
+        :param public_rate_limit: (burst capacity, requests per second) for public endpoints
+        :param private_rate_limit: (burst capacity, requests per second) for authenticated endpoints
+        :param preload_symbols: Monitored trading pair symbols (batched tickers, prebuilt order book URLs) (optional)
+        :param max_retry_after: Longest server-requested Retry-After wait honored, in seconds (longer values fall back to backoff)
         :return: None
         """
         
@@ -76,62 +197,137 @@ class APIClient:  # API client class for Mercado Bitcoin
         self.timeout = timeout  # Store timeout value
         self.max_retries = max_retries  # Store max retries
         self.retry_delay = retry_delay  # Store retry delay
+        self.max_retry_after = max_retry_after  # Store Retry-After cap
+        
+        self.session = requests.Session()  # Persistent session reusing TCP/TLS connections (keep-alive)
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0, pool_block=False)  # Connection pool adapter (retries handled below)
+        self.session.mount("https://", adapter)  # Use pooled adapter for HTTPS requests
+        self.session.headers["Content-Type"] = "application/json"  # Set content type header once for all requests
+        self.executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)  # Worker pool for concurrent independent requests
+        self.public_bucket = TokenBucket(*public_rate_limit)  # Rate limiter for public endpoints
+        self.private_bucket = TokenBucket(*private_rate_limit)  # Rate limiter for authenticated endpoints
+        self.response_cache: Dict[Tuple, Tuple[float, Any]] = {}  # Cached GET responses keyed by (method, URL, params)
+        self.ticker_symbols: Tuple[str, ...] = tuple(preload_symbols or ())  # Symbols whose tickers are fetched together in one batch call
+        self.orderbook_urls: Dict[str, str] = {symbol: f"{base_url}/{symbol}/orderbook" for symbol in preload_symbols or []}  # Prebuilt order book URLs
+        self.market_stream = None  # Optional WebSocket market data stream
+        self.stream_max_age = 0.0  # Maximum accepted age of streamed data in seconds
+
+
+    def attach_market_stream(self, market_stream, max_age: float) -> None:
+        """
+        Attaches a WebSocket market data stream used before falling back to REST.
+        
+        :param market_stream: MarketDataStream instance
+        :param max_age: Maximum accepted age of streamed data in seconds
+        :return: None
+        """
+        
+        self.market_stream = market_stream  # Store market data stream
+        self.stream_max_age = max_age  # Store staleness limit
 
 
-    def make_request(self, method: str, endpoint: str, params: Optional[Dict] = None, data: Optional[Dict] = None, authenticated: bool = True) -> Optional[Dict]:
+    def make_request(self, method: str, endpoint: Optional[str] = None, params: Optional[Dict] = None, data: Optional[Any] = None, authenticated: bool = True, cache_ttl: float = 0.0, url: Optional[str] = None, expected_type: Optional[type] = None) -> Optional[Any]:
         """
         Makes an HTTP request with retry logic.
         
         :param method: HTTP method (GET, POST, DELETE)
-        :param endpoint: API endpoint path
+        :param endpoint: API endpoint path (ignored when url is given)
         :param params: URL query parameters
-        :param data: Request body data
+        :param data: Request body data (a dictionary, or already serialized JSON bytes)
         :param authenticated: Whether to include authentication headers
-        :return: Response JSON data or None if failed
+        :param cache_ttl: Seconds a successful GET response may be reused (0 disables caching)
+        :param url: Prebuilt full URL, skipping URL construction (optional)
+        :param expected_type: Required type of a non-empty response, e.g. list (optional, unchecked if None)
+        :return: Response JSON data or None if failed or not of the expected type
         """
         
-        url = f"{self.base_url}{endpoint}"  # Construct full URL
-        headers = {}  # Initialize headers dictionary
+        if url is None:  # Verify if a prebuilt URL was provided
+            url = f"{self.base_url}{endpoint}"  # Construct full URL
         
-        if authenticated:  # Verify if authentication is required
-            auth_headers = self.authenticator.get_auth_headers()  # Get authentication headers
-            headers.update(auth_headers)  # Add authentication headers
+        cache_key = None  # Initialize cache key
+        if method == "GET" and cache_ttl > 0:  # Verify if response may be served from cache
+            cache_key = (method, url, frozenset((params or {}).items()))  # Build cache key
+            cached = self.response_cache.get(cache_key)  # Get cached entry
+            if cached is not None and time.monotonic() - cached[0] < cache_ttl:  # Verify if cached entry is fresh
+                return cached[1]  # Return cached response
         
-        headers["Content-Type"] = "application/json"  # Set content type header
+        bucket = self.private_bucket if authenticated else self.public_bucket  # Select rate limiter for the endpoint tier
+        body = data if data is None or isinstance(data, bytes) else json_dumps(data)  # Serialize the body once for all attempts
         
         for attempt in range(self.max_retries):  # Retry loop
+            headers = self.authenticator.get_auth_headers() if authenticated else None  # Cached auth headers (Content-Type is set on the session)
+            bucket.consume()  # Wait for a rate limit token before sending
             try:  # Attempt request
                 if method == "GET":  # Handle GET requests
-                    response = requests.get(url, headers=headers, params=params, timeout=self.timeout)  # Send GET request
+                    response = self.session.get(url, headers=headers, params=params, timeout=self.timeout)  # Send GET request
                 elif method == "POST":  # Handle POST requests
-                    response = requests.post(url, headers=headers, json=data, timeout=self.timeout)  # Send POST request
+                    response = self.session.post(url, headers=headers, data=body, timeout=self.timeout)  # Send POST request with pre-serialized JSON body
                 elif method == "DELETE":  # Handle DELETE requests
-                    response = requests.delete(url, headers=headers, params=params, timeout=self.timeout)  # Send DELETE request
+                    response = self.session.delete(url, headers=headers, params=params, timeout=self.timeout)  # Send DELETE request
                 else:  # Unsupported method
                     return None  # Return None for unsupported methods
                 
                 if response.status_code == 200:  # Verify for success
-                    return response.json()  # Return parsed JSON response
+                    try:  # Attempt to parse response body
+                        result = json_loads(response.content)  # Parse JSON directly from the raw response bytes
+                    except ValueError:  # Handle malformed JSON bodies
+                        return None  # Return None for unparsable responses
+                    if expected_type is not None and not (result and isinstance(result, expected_type)):  # Verify if response has the expected shape
+                        return None  # Return None for empty or unexpected responses
+                    if cache_key is not None:  # Verify if response should be cached
+                        self.response_cache[cache_key] = (time.monotonic(), result)  # Store response with timestamp
+                    return result  # Return parsed JSON response
                 elif response.status_code == 401:  # Verify for unauthorized
                     if authenticated:  # If request was authenticated
                         self.authenticator.authenticate()  # Re-authenticate
                         continue  # Retry request
                     return None  # Return None if not authenticated
-                else:  # Other error status codes
+                else:  # Rate limited (429) or other error status codes
                     if attempt < self.max_retries - 1:  # Verify if retries remain
-                        time.sleep(self.retry_delay)  # Wait before retry
+                        retry_after = get_retry_after(response)  # Get server-requested wait time (sent with 429/503)
+                        if retry_after is None or retry_after > self.max_retry_after:  # Verify if the wait is missing or unreasonably long
+                            retry_after = self.get_backoff_delay(attempt)  # Back off instead of freezing the request thread
+                        time.sleep(retry_after)  # Wait before retrying
                         continue  # Retry request
                     return None  # Return None after exhausting retries
                     
-            except Exception:  # Catch any exceptions
+            except requests.RequestException:  # Catch any requests failure (connection, timeout, invalid response, ...)
                 if attempt < self.max_retries - 1:  # Verify if retries remain
-                    time.sleep(self.retry_delay)  # Wait before retry
+                    time.sleep(self.get_backoff_delay(attempt))  # Back off before retry
                     continue  # Retry request
                 return None  # Return None after exhausting retries
         
         return None  # Return None if all retries failed
 
 
+    def get_backoff_delay(self, attempt: int) -> float:
+        """
+        Computes an exponential backoff delay with jitter for a retry attempt.
+        
+        :param attempt: Zero-based index of the failed attempt
+        :return: Delay in seconds (retry_delay * 2^attempt, scaled by a random factor in [0.5, 1.5))
+        """
+        
+        return self.retry_delay * (2 ** attempt) * (0.5 + random.random())  # Exponential growth with jitter to avoid lockstep retries
+
+
+    def invalidate_cache(self, endpoint_suffix: Optional[str] = None) -> None:
+        """
+        Drops cached GET responses.
+        
+        :param endpoint_suffix: Only drop entries whose URL ends with this suffix (all entries if None)
+        :return: None
+        """
+        
+        if endpoint_suffix is None:  # Verify if all entries should be dropped
+            self.response_cache = {}  # Drop all cached responses
+            return  # Exit after clearing
+        
+        self.response_cache = {  # Keep entries for other endpoints
+            key: entry for key, entry in self.response_cache.items() if not key[1].endswith(endpoint_suffix)
+        }
+
+
     def get_accounts(self) -> Optional[List[Dict]]:
         """
         Retrieves list of accounts.
@@ -140,10 +336,7 @@ class APIClient:  # API client class for Mercado Bitcoin
         :return: List of account dictionaries or None if failed
         """
         
-        result = self.make_request("GET", "/accounts")  # Make GET request to accounts endpoint
-        if result and isinstance(result, list):  # Verify if result is a list
-            return result  # Return list of accounts
-        return None  # Return None if not a list
+        return self.make_request("GET", "/accounts", expected_type=list)  # Make GET request to accounts endpoint
 
 
     def get_balances(self, account_id: str) -> Optional[List[Dict]]:
@@ -155,22 +348,27 @@ class APIClient:  # API client class for Mercado Bitcoin
         """
         
         endpoint = f"/accounts/{account_id}/balances"  # Construct endpoint path
-        result = self.make_request("GET", endpoint)  # Make GET request to balances endpoint
-        if result and isinstance(result, list):  # Verify if result is a list
-            return result  # Return list of balances
-        return None  # Return None if not a list
+        return self.make_request("GET", endpoint, expected_type=list)  # Make uncached GET request to balances endpoint (AccountManager caches them)
 
 
-    def get_ticker(self, symbol: str) -> Optional[Dict]:
+    def get_ticker(self, symbol: str, use_stream: bool = True, cache_ttl: float = CACHE_TTLS["ticker"]) -> Optional[Dict]:
         """
         Retrieves ticker information for a symbol.
         
         :param symbol: Trading pair symbol (e.g., BTC-BRL)
+        :param use_stream: Whether a fresh streamed ticker may be returned instead of calling REST
+        :param cache_ttl: Seconds a REST ticker response may be reused (0 always requests a new one)
         :return: Ticker dictionary or None if failed
         """
         
-        endpoint = f"/{symbol}/ticker"  # Construct endpoint path
-        return self.make_request("GET", endpoint, authenticated=False)  # Make GET request to ticker endpoint
+        if use_stream and self.market_stream is not None:  # Verify if a market data stream is attached and may be used
+            ticker = self.market_stream.get_ticker(symbol, self.stream_max_age)  # Get streamed ticker
+            if ticker is not None:  # Verify if streamed ticker is fresh
+                return ticker  # Return streamed ticker without a REST call
+        
+        symbols = self.ticker_symbols if symbol in self.ticker_symbols else (symbol,)  # Batch with the monitored symbols when possible
+        tickers = self.get_tickers_batch(symbols, cache_ttl)  # Get tickers in a single (cached) call
+        return tickers.get(symbol) if tickers else None  # Return ticker for the symbol
 
 
     def get_tickers(self) -> Optional[List[Dict]]:
@@ -181,10 +379,23 @@ class APIClient:  # API client class for Mercado Bitcoin
         :return: List of ticker dictionaries or None if failed
         """
         
-        result = self.make_request("GET", "/tickers", authenticated=False)  # Make GET request to tickers endpoint
-        if result and isinstance(result, list):  # Verify if result is a list
-            return result  # Return list of tickers
-        return None  # Return None if not a list
+        return self.make_request("GET", "/tickers", authenticated=False, cache_ttl=CACHE_TTLS["tickers"], expected_type=list)  # Make GET request to tickers endpoint
+
+
+    def get_tickers_batch(self, symbols: Tuple[str, ...], cache_ttl: float = CACHE_TTLS["ticker"]) -> Optional[Dict[str, Dict]]:
+        """
+        Retrieves ticker information for several symbols in a single request.
+        
+        :param symbols: Trading pair symbols (e.g., ("BTC-BRL", "BTC-USD"))
+        :param cache_ttl: Seconds the response may be reused (0 always requests a new one)
+        :return: Dictionary of ticker dictionaries keyed by symbol or None if failed
+        """
+        
+        params = {"symbols": ",".join(symbols)}  # Join symbols into a CSV query parameter
+        result = self.make_request("GET", "/tickers", params=params, authenticated=False, cache_ttl=cache_ttl, expected_type=list)  # Make one GET request for all symbols
+        if result is None:  # Verify if tickers were retrieved
+            return None  # Return None if request failed
+        return {ticker.get("pair"): ticker for ticker in result}  # Index tickers by symbol
 
 
     def get_orderbook(self, symbol: str) -> Optional[Dict]:
@@ -195,24 +406,36 @@ class APIClient:  # API client class for Mercado Bitcoin
         :return: Order book dictionary or None if failed
         """
         
-        endpoint = f"/{symbol}/orderbook"  # Construct endpoint path
-        return self.make_request("GET", endpoint, authenticated=False)  # Make GET request to orderbook endpoint
+        if self.market_stream is not None:  # Verify if a market data stream is attached
+            orderbook = self.market_stream.get_orderbook(symbol, self.stream_max_age)  # Get streamed order book
+            if orderbook is not None:  # Verify if streamed order book is fresh
+                return orderbook  # Return streamed order book without a REST call
+        
+        url = self.orderbook_urls.get(symbol) or f"{self.base_url}/{symbol}/orderbook"  # Use prebuilt URL when available
+        return self.make_request("GET", url=url, authenticated=False, cache_ttl=CACHE_TTLS["orderbook"])  # Make GET request to orderbook endpoint
 
 
-    def get_orders(self, account_id: str, symbol: str) -> Optional[List[Dict]]:
+    def get_orders(self, account_id: str, symbol: str, side: Optional[str] = None, status: Optional[str] = None) -> Optional[List[Dict]]:
         """
-        Retrieves orders for a specific account and symbol.
+        Retrieves orders for a specific account and symbol, optionally filtered server-side.
+        The endpoint returns the whole matching order list as a plain JSON array, without a pagination cursor or page size, so a single request is complete.
         
         :param account_id: Account identifier
         :param symbol: Trading pair symbol (e.g., BTC-BRL)
+        :param side: Order side filter (buy or sell), optional
+        :param status: Order status filter (e.g., filled), optional
         :return: List of order dictionaries or None if failed
         """
         
         endpoint = f"/accounts/{account_id}/{symbol}/orders"  # Construct endpoint path
-        result = self.make_request("GET", endpoint)  # Make GET request to orders endpoint
-        if result and isinstance(result, list):  # Verify if result is a list
-            return result  # Return list of orders
-        return None  # Return None if not a list
+        
+        params = {}  # Initialize query parameters
+        if side is not None:  # Verify if side filter is provided
+            params["side"] = side  # Add side filter
+        if status is not None:  # Verify if status filter is provided
+            params["status"] = status  # Add status filter
+        
+        return self.make_request("GET", endpoint, params=params or None, expected_type=list)  # Make GET request to orders endpoint
 
 
     def get_all_orders(self, account_id: str) -> Optional[Dict]:
@@ -257,6 +480,11 @@ class APIClient:  # API client class for Mercado Bitcoin
         
         endpoint = f"/accounts/{account_id}/{symbol}/orders"  # Construct endpoint path
         
+        if order_type == "market" and limit_price is None and (qty is None) != (cost is None):  # Verify if this is a plain market order with a single size field
+            template = MARKET_ORDER_BODIES.get((side, "qty" if qty is not None else "cost"))  # Get pre-serialized body for the side and size field
+            if template is not None:  # Verify if the side is known
+                return self.make_request("POST", endpoint, data=template % str(qty if qty is not None else cost).encode("ascii"))  # Fill in only the size value
+        
         order_data = {  # Construct order data
             "side": side,  # Order side
             "type": order_type,  # Order type
@@ -297,10 +525,7 @@ class APIClient:  # API client class for Mercado Bitcoin
         """
         
         endpoint = f"/accounts/{account_id}/positions"  # Construct endpoint path
-        result = self.make_request("GET", endpoint)  # Make GET request to positions endpoint
-        if result and isinstance(result, list):  # Verify if result is a list
-            return result  # Return list of positions
-        return None  # Return None if not a list
+        return self.make_request("GET", endpoint, expected_type=list)  # Make GET request to positions endpoint
 
 
     def get_executions(self, account_id: str, symbol: str, order_id: str) -> Optional[List[Dict]]:
@@ -319,7 +544,57 @@ class APIClient:  # API client class for Mercado Bitcoin
         return None  # Return None if no executions found
 
 
-def create_api_client(authenticator, base_url: str, timeout: int = 30, max_retries: int = 3, retry_delay: int = 2) -> APIClient:
+    def run_concurrently(self, calls: List[Tuple[Callable, Tuple]]) -> List[Any]:
+        """
+        Runs independent API calls concurrently over the pooled session.
+        
+        :param calls: List of (callable, arguments tuple) pairs, e.g. [(client.get_ticker, ("BTC-BRL",))]
+        :return: List of results in the same order as calls (None for calls that raised)
+        """
+        
+        futures = [self.executor.submit(func, *args) for func, args in calls]  # Dispatch all calls at once
+        
+        results = []  # Initialize results list
+        for future in futures:  # Collect results in submission order
+            try:  # Attempt to get call result
+                results.append(future.result())  # Append call result
+            except Exception:  # Handle call failures
+                results.append(None)  # Append None for failed calls
+        return results  # Return results list
+
+
+    def close(self) -> None:
+        """
+        Closes the market data stream, the worker pool and the underlying HTTP session.
+        
+        :param: None
+        :return: None
+        """
+        
+        if self.market_stream is not None:  # Verify if a market data stream is attached
+            self.market_stream.stop()  # Stop the WebSocket connection
+        self.executor.shutdown(wait=False)  # Stop accepting concurrent calls
+        self.session.close()  # Close session connections
+
+
+def get_retry_after(response) -> Optional[float]:
+    """
+    Parses the Retry-After header of a response.
+    
+    :param response: HTTP response object
+    :return: Seconds to wait as float or None if header missing or invalid
+    """
+    
+    value = response.headers.get("Retry-After")  # Get Retry-After header
+    if value is None:  # Verify if header exists
+        return None  # Return None if missing
+    try:  # Attempt to parse seconds value
+        return max(0.0, float(value))  # Return non-negative wait time
+    except ValueError:  # Handle HTTP-date or invalid values
+        return None  # Return None if not a number of seconds
+
+
+def create_api_client(authenticator, base_url: str, timeout: int = 30, max_retries: int = 3, retry_delay: int = 2, pool_connections: int = 20, pool_maxsize: int = 40, public_rate_limit: Tuple[float, float] = (6, 3), private_rate_limit: Tuple[float, float] = (10, 5), preload_symbols: Optional[List[str]] = None, max_retry_after: float = 30.0) -> APIClient:
     """
     Factory function to create an APIClient instance.
     
@@ -328,7 +603,13 @@ def create_api_client(authenticator, base_url: str, timeout: int = 30, max_retri
     :param timeout: Request timeout in seconds
     :param max_retries: Maximum number of retry attempts
     :param retry_delay: Delay between retries in seconds
+    :param pool_connections: Number of host connection pools to keep
+    :param pool_maxsize: Maximum keep-alive connections per host pool
+    :param public_rate_limit: (burst capacity, requests per second) for public endpoints
+    :param private_rate_limit: (burst capacity, requests per second) for authenticated endpoints
+    :param preload_symbols: Monitored trading pair symbols (batched tickers, prebuilt order book URLs) (optional)
+    :param max_retry_after: Longest server-requested Retry-After wait honored, in seconds (longer values fall back to backoff)
     :return: Initialized APIClient instance
     """
     
-    return APIClient(authenticator, base_url, timeout, max_retries, retry_delay)  # Create and return APIClient instance
+    return APIClient(authenticator, base_url, timeout, max_retries, retry_delay, pool_connections, pool_maxsize, public_rate_limit, private_rate_limit, preload_symbols, max_retry_after)  # Create and return APIClient instance
@@ -12,7 +12,7 @@ Description :
     Key features include:
         - OAuth2 client credentials authentication
         - Access token generation and storage
-        - Automatic token refresh before expiration
+        - Automatic token refresh before expiration in a background thread
         - Thread-safe token management
         - Request signing and header generation
         - Token validation
@@ -37,18 +37,33 @@ TODOs:
 Dependencies:
     - Python >= 3.8
     - requests
+    - threading (standard library)
     - time (standard library)
     - typing (standard library)
 
 Assumptions & Notes:
     - Uses OAuth2 client credentials flow
     - Tokens are stored in memory only
-    - Token refresh happens automatically before expiration
+    - Token refresh happens automatically before expiration, off the request path
+    - The Authorization header value is pre-encoded to bytes once per token
+    - Token expiry uses integer time.monotonic_ns() deadlines, unaffected by
+      wall-clock adjustments
+    - Token requests are serialized by a lock, since the refresh thread and
+      request threads may renew the token at the same time
+    - The refresh thread sleeps at least TOKEN_REFRESH_RETRY_DELAY seconds
+      between attempts, even for very short token lifetimes
 """
 
 import requests  # For HTTP requests
+import threading  # For the background token refresh thread
 import time  # For timestamp operations and token expiration
-from typing import Dict, Optional  # For type hints
+from typing import Dict, Optional, Union  # For type hints
+
+
+# Token Constants:
+TOKEN_EXPIRY_BUFFER = 300  # Seconds before the reported expiry at which a token is treated as expired
+NANOSECONDS_PER_SECOND = 1_000_000_000  # Conversion factor for monotonic_ns deadlines
+TOKEN_REFRESH_RETRY_DELAY = 10  # Seconds to wait before retrying a failed background refresh
 
 
 class Authenticator:  # Authentication handler class
@@ -58,6 +73,20 @@ class Authenticator:  # Authentication handler class
     :param: None
     :return: None
     """
+    
+    __slots__ = (  # Fixed attribute layout, avoids a per-instance __dict__
+        "api_key",  # API key
+        "api_secret",  # API secret
+        "base_url",  # Base URL
+        "access_token",  # Current access token
+        "token_expiry_ns",  # Token expiry deadline
+        "token_type",  # Token type
+        "auth_header_value",  # Encoded Authorization header value
+        "cached_headers",  # Authorization headers
+        "refresh_thread",  # Background token refresh thread
+        "refresh_stop_event",  # Background token refresh stop signal
+        "auth_lock",  # Serializes token requests and token state updates
+    )
 
 
     def __init__(self, api_key: str, api_secret: str, base_url: str):
@@ -74,13 +103,30 @@ class Authenticator:  # Authentication handler class
         self.api_secret = api_secret  # Store API secret
         self.base_url = base_url  # Store base URL
         self.access_token: Optional[str] = None  # Initialize access token as None
-        self.token_expiry: float = 0.0  # Initialize token expiry timestamp
+        self.token_expiry_ns: int = 0  # Initialize token expiry deadline in nanoseconds (time.monotonic_ns() clock)
         self.token_type: str = "Bearer"  # Default token type
+        self.auth_header_value: bytes = b""  # Encoded Authorization header value for the current token
+        self.cached_headers: Dict[str, Union[str, bytes]] = {}  # Authorization headers built once per token
+        self.refresh_thread: Optional[threading.Thread] = None  # Background token refresh thread
+        self.refresh_stop_event = threading.Event()  # Signal to stop the background refresh
+        self.auth_lock = threading.Lock()  # Refresh thread and request threads may authenticate at the same time
 
 
     def authenticate(self) -> bool:
         """
-        Authenticates with the API and obtains an access token.
+        Authenticates with the API and obtains an access token (one token request at a time).
+        
+        :param: None
+        :return: True if authentication successful, False otherwise
+        """
+        
+        with self.auth_lock:  # Serialize the token request and the token state updates
+            return self.request_token()  # Request and store a new token
+
+
+    def request_token(self) -> bool:
+        """
+        Requests an access token and stores it; callers must hold auth_lock.
         
         :param: None
         :return: True if authentication successful, False otherwise
@@ -112,7 +158,10 @@ class Authenticator:  # Authentication handler class
                 self.access_token = data.get("access_token")  # Extract access token
                 expires_in = data.get("expires_in", 3600)  # Extract expiry time (default 1 hour)
                 self.token_type = data.get("token_type", "Bearer")  # Extract token type
-                self.token_expiry = time.time() + expires_in - 300  # Set expiry with 5-minute buffer
+                lifetime = int(expires_in)  # Token lifetime in seconds
+                self.token_expiry_ns = time.monotonic_ns() + (lifetime - min(TOKEN_EXPIRY_BUFFER, lifetime // 2)) * NANOSECONDS_PER_SECOND  # Set integer monotonic expiry deadline with a 5-minute buffer (at most half of a short lifetime)
+                self.auth_header_value = f"{self.token_type} {self.access_token}".encode("ascii")  # Encode header value once for this token
+                self.cached_headers = {"Authorization": self.auth_header_value}  # Build headers once for this token (bytes are sent as-is)
                 return True  # Return success
             else:  # Authentication failed
                 return False  # Return failure
@@ -129,11 +178,7 @@ class Authenticator:  # Authentication handler class
         :return: True if token is valid, False otherwise
         """
         
-        if not self.access_token:  # Verify if token exists
-            return False  # Return False if no token
-        if time.time() >= self.token_expiry:  # Verify if token is expired
-            return False  # Return False if expired
-        return True  # Return True if token is valid
+        return self.access_token is not None and time.monotonic_ns() < self.token_expiry_ns  # Token exists and its deadline has not passed (integer compare)
 
 
     def ensure_authenticated(self) -> bool:
@@ -146,13 +191,18 @@ class Authenticator:  # Authentication handler class
         
         if self.is_token_valid():  # Verify if current token is valid
             return True  # Return True if already valid
-        return self.authenticate()  # Otherwise attempt to authenticate
+        with self.auth_lock:  # Serialize with other threads renewing the token
+            if self.is_token_valid():  # Verify if another thread renewed the token while waiting
+                return True  # Reuse the renewed token
+            return self.request_token()  # Otherwise attempt to authenticate
 
 
-    def get_auth_headers(self) -> Dict[str, str]:
+    def get_auth_headers(self) -> Dict[str, Union[str, bytes]]:
         """
         Returns authorization headers for API requests.
         
+        The returned dictionary is shared between calls and must not be modified.
+        
         :param: None
         :return: Dictionary containing authorization headers
         """
@@ -160,9 +210,51 @@ class Authenticator:  # Authentication handler class
         if not self.ensure_authenticated():  # Ensure valid authentication
             return {}  # Return empty dict if authentication fails
         
-        return {  # Return authorization headers
-            "Authorization": f"{self.token_type} {self.access_token}",  # Bearer token header
-        }
+        return self.cached_headers  # Return headers built for the current token
+
+
+    def start_auto_refresh(self) -> None:
+        """
+        Starts a daemon thread that renews the token before it expires, so requests never wait on authentication.
+        
+        :param: None
+        :return: None
+        """
+        
+        if self.refresh_thread is not None and self.refresh_thread.is_alive():  # Verify if already running
+            return  # Do nothing if already started
+        
+        self.refresh_stop_event.clear()  # Reset stop signal
+        self.refresh_thread = threading.Thread(target=self.refresh_loop, name="TokenRefresh", daemon=True)  # Create daemon thread
+        self.refresh_thread.start()  # Start refresh thread
+
+
+    def stop_auto_refresh(self) -> None:
+        """
+        Stops the background token refresh thread.
+        
+        :param: None
+        :return: None
+        """
+        
+        self.refresh_stop_event.set()  # Signal refresh loop to stop
+
+
+    def refresh_loop(self) -> None:
+        """
+        Sleeps until the token deadline and re-authenticates, until stopped.
+        
+        :param: None
+        :return: None
+        """
+        
+        while True:  # Loop until stop is requested
+            wait = max(TOKEN_REFRESH_RETRY_DELAY, (self.token_expiry_ns - time.monotonic_ns()) / NANOSECONDS_PER_SECOND)  # Seconds until the refresh deadline (never a tight loop, even for very short token lifetimes)
+            if self.refresh_stop_event.wait(wait):  # Sleep until the deadline (returns True early on stop)
+                return  # Exit if stop was requested
+            if not self.authenticate():  # Verify if refresh failed
+                if self.refresh_stop_event.wait(TOKEN_REFRESH_RETRY_DELAY):  # Wait before retrying (returns True early on stop)
+                    return  # Exit if stop was requested
 
 
     def get_access_token(self) -> Optional[str]:
@@ -190,4 +282,5 @@ def create_authenticator(api_key: str, api_secret: str, base_url: str) -> Authen
     
     auth = Authenticator(api_key, api_secret, base_url)  # Create authenticator instance
     auth.authenticate()  # Perform initial authentication
+    auth.start_auto_refresh()  # Keep the token fresh in the background
     return auth  # Return authenticated instance
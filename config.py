@@ -18,10 +18,13 @@ Description :
         - Safety thresholds and limits
 
 Usage:
-    1. Set environment variables MB_API_KEY and MB_API_SECRET before running.
+    1. Set environment variables MB_API_KEY and MB_API_SECRET before running
+       (optionally MB_LOG_EVERY_TICK=1 to log prices on every cycle).
     2. Import this module to access configuration constants.
         from config import Config
-    3. Access configuration via Config class attributes.
+    3. Access configuration via Config class attributes, or import the
+       module-level Final constants directly on hot paths.
+        from config import PRIMARY_SYMBOL
 
 Outputs:
     - No direct outputs (configuration only)
@@ -33,15 +36,60 @@ TODOs:
 
 Dependencies:
     - Python >= 3.8
+    - functools (standard library)
     - os (standard library)
+    - typing (standard library)
 
 Assumptions & Notes:
     - API credentials must be set as environment variables
     - Default values are used if environment variables are not set
     - All percentage values are in decimal format (0.10 = 10%)
+    - validate_config() is memoized since configuration does not change at runtime
 """
 
 import os  # For accessing environment variables
+from functools import lru_cache  # For memoizing configuration validation
+from typing import Final  # For constant type hints
+
+
+# API Constants:
+API_KEY: Final = os.getenv("MB_API_KEY", "")  # API key from environment variable
+API_SECRET: Final = os.getenv("MB_API_SECRET", "")  # API secret from environment variable
+BASE_URL: Final = "https://api.mercadobitcoin.net/api/v4"  # Base URL for API v4
+TIMEOUT: Final = 30  # Request timeout in seconds
+MAX_RETRIES: Final = 3  # Maximum number of retries for failed requests
+RETRY_DELAY: Final = 2  # Delay between retries in seconds
+MAX_RETRY_AFTER: Final = 30  # Longest server-requested Retry-After wait honored in seconds (longer values fall back to backoff)
+POOL_CONNECTIONS: Final = 20  # Number of host connection pools kept by the HTTP session
+POOL_MAXSIZE: Final = 40  # Maximum keep-alive connections per host pool
+PUBLIC_RATE_LIMIT: Final = (6, 3)  # (burst capacity, requests per second) for public endpoints
+PRIVATE_RATE_LIMIT: Final = (10, 5)  # (burst capacity, requests per second) for authenticated endpoints
+WS_URL: Final = "wss://ws.mercadobitcoin.net/ws"  # WebSocket endpoint for streamed market data
+WS_RECONNECT_DELAY: Final = 5  # Delay in seconds before reconnecting a dropped WebSocket
+STREAM_MAX_AGE: Final = 10  # Maximum age in seconds of streamed data before falling back to REST (and resetting the stream)
+
+# Monitoring Constants:
+VERIFICATION_INTERVAL: Final = 60  # Interval in seconds between price verifications
+SYMBOLS_TO_MONITOR: Final = ("BTC-BRL", "BTC-USD")  # Trading pairs to monitor
+PRIMARY_SYMBOL: Final = "BTC-BRL"  # Primary symbol for trading operations
+CRYPTO_SYMBOL: Final = "BTC"  # Cryptocurrency symbol
+FIAT_SYMBOL: Final = "BRL"  # Fiat currency symbol
+PRICE_CACHE_MAX_AGE: Final = 0.2  # Seconds a fetched price snapshot is shared between readers
+AVERAGE_PRICE_MAX_AGE: Final = 300  # Seconds a calculated average price is reused before recalculating
+AVERAGE_PRICE_BUCKET: Final = 0.005  # Relative width of the average price buckets executed rules are tracked in (0.5%)
+EXECUTED_RULES_FILE: Final = os.getenv("MB_EXECUTED_RULES_PATH", "executed_rules.bitset")  # File persisting executed rules across restarts (empty disables, relative paths are relative to this directory)
+EXECUTED_RULES_PATH: Final = os.path.join(os.path.dirname(os.path.abspath(__file__)), EXECUTED_RULES_FILE) if EXECUTED_RULES_FILE else ""  # Absolute executed rules file path (independent of the working directory)
+MAX_PRICE_AGE: Final = 2.0  # Maximum age in seconds of a price (since it was received from the stream or requested from REST) when placing an order based on it
+LOG_EVERY_TICK: Final = os.getenv("MB_LOG_EVERY_TICK", "") == "1"  # Log current and average prices on every cycle (verbose)
+
+# Trading Rule Constants:
+BTC_BUY_RULES: Final = (  # (threshold, amount) buy rules sorted from highest to lowest threshold
+    (0.25, 0.50),  # 25% above average price triggers buy of 50% BRL balance
+    (0.20, 0.20),  # 20% above average price triggers buy of 20% BRL balance
+    (0.10, 0.10),  # 10% above average price triggers buy of 10% BRL balance
+)
+BTC_SELL_THRESHOLD: Final = 1.00  # 100% above average price (double) triggers sell
+BTC_SELL_AMOUNT: Final = 0.20  # Sell 20% of BTC position
 
 
 # Classes Definitions:
@@ -49,75 +97,95 @@ import os  # For accessing environment variables
 
 class TradingRules:
     """
-    Trading rules for BTC operations.
+    Trading rules for BTC operations (re-exports the module-level constants).
     
     :param: None
     :return: None
     """
     
-    BTC_BUY_THRESHOLD_1 = 0.10  # 10% above average price triggers buy of 10% BRL balance
-    BTC_BUY_AMOUNT_1 = 0.10  # Buy 10% of available BRL balance
-    
-    BTC_BUY_THRESHOLD_2 = 0.20  # 20% above average price triggers buy of 20% BRL balance
-    BTC_BUY_AMOUNT_2 = 0.20  # Buy 20% of available BRL balance
-    
-    BTC_BUY_THRESHOLD_3 = 0.25  # 25% above average price triggers buy of 50% BRL balance
-    BTC_BUY_AMOUNT_3 = 0.50  # Buy 50% of available BRL balance
-    
-    BTC_SELL_THRESHOLD = 1.00  # 100% above average price (double) triggers sell
-    BTC_SELL_AMOUNT = 0.20  # Sell 20% of BTC position
+    BTC_BUY_RULES = BTC_BUY_RULES  # Buy rules
+    BTC_SELL_THRESHOLD = BTC_SELL_THRESHOLD  # Sell threshold
+    BTC_SELL_AMOUNT = BTC_SELL_AMOUNT  # Sell amount
 
 
 class APIConfig:  # API configuration constants
     """
-    API configuration for Mercado Bitcoin.
+    API configuration for Mercado Bitcoin (re-exports the module-level constants).
     
     :param: None
     :return: None
     """
     
-    BASE_URL = "https://api.mercadobitcoin.net/api/v4"  # Base URL for API v4
-    TIMEOUT = 30  # Request timeout in seconds
-    MAX_RETRIES = 3  # Maximum number of retries for failed requests
-    RETRY_DELAY = 2  # Delay between retries in seconds
+    BASE_URL = BASE_URL  # Base URL for API v4
+    TIMEOUT = TIMEOUT  # Request timeout in seconds
+    MAX_RETRIES = MAX_RETRIES  # Maximum number of retries for failed requests
+    RETRY_DELAY = RETRY_DELAY  # Delay between retries in seconds
+    MAX_RETRY_AFTER = MAX_RETRY_AFTER  # Longest honored Retry-After wait
+    POOL_CONNECTIONS = POOL_CONNECTIONS  # Number of host connection pools
+    POOL_MAXSIZE = POOL_MAXSIZE  # Maximum keep-alive connections per host pool
+    PUBLIC_RATE_LIMIT = PUBLIC_RATE_LIMIT  # Public endpoints rate limit
+    PRIVATE_RATE_LIMIT = PRIVATE_RATE_LIMIT  # Authenticated endpoints rate limit
+    WS_URL = WS_URL  # WebSocket endpoint
+    WS_RECONNECT_DELAY = WS_RECONNECT_DELAY  # WebSocket reconnect delay
+    STREAM_MAX_AGE = STREAM_MAX_AGE  # Maximum streamed data age
 
 
 class MonitoringConfig:  # Monitoring configuration constants
     """
-    Monitoring and execution configuration.
+    Monitoring and execution configuration (re-exports the module-level constants).
     
     :param: None
     :return: None
     """
     
-    VERIFICATION_INTERVAL = 60  # Interval in seconds between price verifications
-    SYMBOLS_TO_MONITOR = ["BTC-BRL", "BTC-USD"]  # List of trading pairs to monitor
-    PRIMARY_SYMBOL = "BTC-BRL"  # Primary symbol for trading operations
-    CRYPTO_SYMBOL = "BTC"  # Cryptocurrency symbol
-    FIAT_SYMBOL = "BRL"  # Fiat currency symbol
+    VERIFICATION_INTERVAL = VERIFICATION_INTERVAL  # Interval in seconds between price verifications
+    SYMBOLS_TO_MONITOR = SYMBOLS_TO_MONITOR  # Trading pairs to monitor
+    PRIMARY_SYMBOL = PRIMARY_SYMBOL  # Primary symbol for trading operations
+    CRYPTO_SYMBOL = CRYPTO_SYMBOL  # Cryptocurrency symbol
+    FIAT_SYMBOL = FIAT_SYMBOL  # Fiat currency symbol
+    PRICE_CACHE_MAX_AGE = PRICE_CACHE_MAX_AGE  # Shared price snapshot window
+    AVERAGE_PRICE_MAX_AGE = AVERAGE_PRICE_MAX_AGE  # Average price reuse window
+    AVERAGE_PRICE_BUCKET = AVERAGE_PRICE_BUCKET  # Relative average price bucket width
+    EXECUTED_RULES_PATH = EXECUTED_RULES_PATH  # Executed rules file
+    MAX_PRICE_AGE = MAX_PRICE_AGE  # Price age limit for orders
+    LOG_EVERY_TICK = LOG_EVERY_TICK  # Verbose per-cycle price logs
 
 
 class Config:  # Main configuration class
     """
-    Main configuration class aggregating all settings.
+    Main configuration class aggregating all settings (kept for backward compatibility).
     
     :param: None
     :return: None
     """
     
-    API_KEY = os.getenv("MB_API_KEY", "")  # API key from environment variable
-    API_SECRET = os.getenv("MB_API_SECRET", "")  # API secret from environment variable
-    
-    BASE_URL = APIConfig.BASE_URL  # Base URL for API requests
-    TIMEOUT = APIConfig.TIMEOUT  # Request timeout
-    MAX_RETRIES = APIConfig.MAX_RETRIES  # Maximum retries
-    RETRY_DELAY = APIConfig.RETRY_DELAY  # Retry delay
-    
-    VERIFICATION_INTERVAL = MonitoringConfig.VERIFICATION_INTERVAL  # Price verification interval
-    SYMBOLS = MonitoringConfig.SYMBOLS_TO_MONITOR  # Symbols to monitor
-    PRIMARY_SYMBOL = MonitoringConfig.PRIMARY_SYMBOL  # Primary trading symbol
-    CRYPTO = MonitoringConfig.CRYPTO_SYMBOL  # Crypto symbol
-    FIAT = MonitoringConfig.FIAT_SYMBOL  # Fiat symbol
+    API_KEY = API_KEY  # API key from environment variable
+    API_SECRET = API_SECRET  # API secret from environment variable
+    
+    BASE_URL = BASE_URL  # Base URL for API requests
+    TIMEOUT = TIMEOUT  # Request timeout
+    MAX_RETRIES = MAX_RETRIES  # Maximum retries
+    RETRY_DELAY = RETRY_DELAY  # Retry delay
+    MAX_RETRY_AFTER = MAX_RETRY_AFTER  # Longest honored Retry-After wait
+    POOL_CONNECTIONS = POOL_CONNECTIONS  # HTTP connection pools
+    POOL_MAXSIZE = POOL_MAXSIZE  # HTTP connections per pool
+    PUBLIC_RATE_LIMIT = PUBLIC_RATE_LIMIT  # Public endpoints rate limit
+    PRIVATE_RATE_LIMIT = PRIVATE_RATE_LIMIT  # Authenticated endpoints rate limit
+    WS_URL = WS_URL  # WebSocket endpoint
+    WS_RECONNECT_DELAY = WS_RECONNECT_DELAY  # WebSocket reconnect delay
+    STREAM_MAX_AGE = STREAM_MAX_AGE  # Maximum streamed data age
+    
+    VERIFICATION_INTERVAL = VERIFICATION_INTERVAL  # Price verification interval
+    SYMBOLS = SYMBOLS_TO_MONITOR  # Symbols to monitor
+    PRIMARY_SYMBOL = PRIMARY_SYMBOL  # Primary trading symbol
+    CRYPTO = CRYPTO_SYMBOL  # Crypto symbol
+    FIAT = FIAT_SYMBOL  # Fiat symbol
+    PRICE_CACHE_MAX_AGE = PRICE_CACHE_MAX_AGE  # Shared price snapshot window
+    AVERAGE_PRICE_MAX_AGE = AVERAGE_PRICE_MAX_AGE  # Average price reuse window
+    AVERAGE_PRICE_BUCKET = AVERAGE_PRICE_BUCKET  # Relative average price bucket width
+    EXECUTED_RULES_PATH = EXECUTED_RULES_PATH  # Executed rules file
+    MAX_PRICE_AGE = MAX_PRICE_AGE  # Price age limit for orders
+    LOG_EVERY_TICK = LOG_EVERY_TICK  # Verbose per-cycle price logs
     
     RULES = TradingRules  # Trading rules reference
 
@@ -125,9 +193,10 @@ class Config:  # Main configuration class
 # Functions Definitions:
 
 
+@lru_cache(maxsize=1)  # Configuration is immutable after import, validate only once
 def validate_config():
     """
-    Validates that all required configuration values are set.
+    Validates that all required configuration values are set (result cached after the first call).
     
     :param: None
     :return: True if configuration is valid, False otherwise
@@ -11,7 +11,7 @@ Description :
 
     Key features include:
         - OAuth2 authentication with Mercado Bitcoin API v4
-        - Real-time price monitoring for BTC-BRL and BTC-USD
+        - Real-time price monitoring for BTC-BRL and BTC-USD via WebSocket (REST fallback)
         - Average purchase price calculation from order history
         - Rule-based automatic buy orders (10%, 20%, 25% thresholds)
         - Rule-based automatic sell orders (100% threshold)
@@ -37,30 +37,32 @@ TODOs:
 Dependencies:
     - Python >= 3.8
     - requests
-    - colorama
+    - websocket-client
     - Logger (custom module)
     - config, auth, api_client, account, trader modules
 
 Assumptions & Notes:
     - API credentials must be set as environment variables
+    - Bot modules (and requests/websocket-client) are imported lazily, so a
+      misconfigured run exits without paying their import cost
     - Bot runs continuously until stopped manually
     - Only BTC trading is currently implemented
     - Uses market orders for execution
 """
 
-import atexit  # For playing a sound when the program finishes
+import atexit  # For playing a sound, closing the API client and stopping the token refresh when the program finishes
 import datetime  # For getting the current date and time
+import functools  # For type-dispatched time conversion
 import os  # For running a command in the terminal
 import platform  # For getting the operating system name
+import signal  # For stopping the bot on Ctrl+C and termination signals
+import subprocess  # For playing the sound without blocking
 import sys  # For system-specific parameters and functions
-from account import create_account_manager  # For account management
-from api_client import create_api_client  # For API communication
-from auth import create_authenticator  # For API authentication
-from colorama import Style  # For coloring the terminal
+import time  # For measuring the execution time with a monotonic clock
+import traceback  # For logging full tracebacks of unexpected errors
 from config import Config, validate_config, get_config_summary  # For configuration management
 from Logger import Logger  # For logging output to both terminal and file
 from pathlib import Path  # For handling file paths
-from trader import create_trading_bot  # For trading logic
 
 
 # Macros:
@@ -72,6 +74,30 @@ class BackgroundColors:  # Colors for the terminal
     BOLD = "\033[1m"  # Bold
     UNDERLINE = "\033[4m"  # Underline
     CLEAR_TERMINAL = "\033[H\033[J"  # Clear the terminal
+    RESET = "\033[0m"  # Reset all styles
+
+
+if sys.__stdout__ is None or not sys.__stdout__.isatty():  # If the real stdout is not a terminal
+    for color_name in ("CYAN", "GREEN", "YELLOW", "RED", "BOLD", "UNDERLINE", "CLEAR_TERMINAL", "RESET"):  # Iterate through escape codes
+        setattr(BackgroundColors, color_name, "")  # Disable escape codes so redirected output stays plain
+
+
+# Output Templates:
+BALANCE_LINE_TEMPLATE = BackgroundColors.CYAN + "  {0}: " + BackgroundColors.YELLOW + "Available={1}, Total={2}" + BackgroundColors.RESET  # Balance line (symbol, available, total), filled per balance
+TRADING_RULES_BLOCK = "\n".join(  # Trading rules are fixed after import, so the whole block is built once
+    [f"{BackgroundColors.GREEN}Trading rules configured:{BackgroundColors.RESET}"]  # Header line
+    + [
+        f"{BackgroundColors.CYAN}  BUY {amount*100:.0f}% of {Config.FIAT} when price is {threshold*100:.0f}% above average{BackgroundColors.RESET}"
+        for threshold, amount in reversed(Config.RULES.BTC_BUY_RULES)  # Buy rules from lowest to highest threshold
+    ]
+    + [f"{BackgroundColors.CYAN}  SELL {Config.RULES.BTC_SELL_AMOUNT*100:.0f}% of {Config.CRYPTO} when price is {Config.RULES.BTC_SELL_THRESHOLD*100:.0f}% above average{BackgroundColors.RESET}"]  # Sell rule line
+)
+TIMING_TEMPLATE = (  # Start, finish and execution time block, filled once at the end of the run
+    "\n" + BackgroundColors.GREEN + "Start time: " + BackgroundColors.CYAN + "{start}"
+    + "\n" + BackgroundColors.GREEN + "Finish time: " + BackgroundColors.CYAN + "{finish}"
+    + "\n" + BackgroundColors.GREEN + "Execution time: " + BackgroundColors.CYAN + "{elapsed}" + BackgroundColors.RESET
+)
+TIMESTAMP_FORMAT = "%d/%m/%Y - %H:%M:%S"  # Format of the start and finish timestamps
 
 
 # Execution Constants:
@@ -89,6 +115,8 @@ SOUND_COMMANDS = {
     "Windows": "start",
 }  # The commands to play a sound for each operating system
 SOUND_FILE = "./.assets/Sounds/NotificationSound.wav"  # The path to the sound file
+CURRENT_OS = platform.system()  # The current operating system (resolved once at import)
+SOUND_FILE_EXISTS = os.path.exists(SOUND_FILE)  # Whether the sound file exists (resolved once at import)
 
 # RUN_FUNCTIONS:
 RUN_FUNCTIONS = {
@@ -122,13 +150,13 @@ def display_configuration_summary():
     """
 
     verbose_output(
-        f"{BackgroundColors.GREEN}Configuration valid. Summary:{Style.RESET_ALL}"
+        f"{BackgroundColors.GREEN}Configuration valid. Summary:{BackgroundColors.RESET}"
     )  # Output configuration valid message
 
     config_summary = get_config_summary()  # Get configuration summary
     for key, value in config_summary.items():  # Iterate through configuration items
         verbose_output(
-            f"{BackgroundColors.CYAN}  {key}: {BackgroundColors.YELLOW}{value}{Style.RESET_ALL}"
+            f"{BackgroundColors.CYAN}  {key}: {BackgroundColors.YELLOW}{value}{BackgroundColors.RESET}"
         )  # Output each configuration item
 
 
@@ -141,23 +169,27 @@ def initialize_authenticator():
     """
 
     print(
-        f"\n{BackgroundColors.GREEN}Initializing authenticator...{Style.RESET_ALL}"
+        f"\n{BackgroundColors.GREEN}Initializing authenticator...{BackgroundColors.RESET}"
     )  # Output authentication initialization message
 
+    from auth import create_authenticator  # Imported lazily: only needed once the configuration is valid
+
     authenticator = create_authenticator(  # Create authenticator instance
         Config.API_KEY,  # API key from config
         Config.API_SECRET,  # API secret from config
         Config.BASE_URL  # Base URL from config
     )
+    atexit.register(authenticator.stop_auto_refresh)  # Stop the token refresh thread once at exit
 
     if not authenticator.is_token_valid():  # Verify if authentication successful
         print(
-            f"{BackgroundColors.RED}Authentication failed!{Style.RESET_ALL}"
+            f"{BackgroundColors.RED}Authentication failed!{BackgroundColors.RESET}"
         )  # Output authentication failure
+        authenticator.stop_auto_refresh()  # Stop refreshing a token that cannot be obtained
         return None  # Exit if authentication failed
 
     print(
-        f"{BackgroundColors.GREEN}Authentication successful!{Style.RESET_ALL}"
+        f"{BackgroundColors.GREEN}Authentication successful!{BackgroundColors.RESET}"
     )  # Output authentication success
     return authenticator
 
@@ -171,20 +203,49 @@ def initialize_api_client(authenticator):
     """
 
     print(
-        f"{BackgroundColors.GREEN}Initializing API client...{Style.RESET_ALL}"
+        f"{BackgroundColors.GREEN}Initializing API client...{BackgroundColors.RESET}"
     )  # Output API client initialization message
 
+    from api_client import create_api_client  # Imported lazily: only needed once the configuration is valid
+
     api_client = create_api_client(  # Create API client instance
         authenticator,  # Authenticator instance
         Config.BASE_URL,  # Base URL from config
         Config.TIMEOUT,  # Timeout from config
         Config.MAX_RETRIES,  # Max retries from config
-        Config.RETRY_DELAY  # Retry delay from config
+        Config.RETRY_DELAY,  # Retry delay from config
+        Config.POOL_CONNECTIONS,  # HTTP connection pools from config
+        Config.POOL_MAXSIZE,  # HTTP connections per pool from config
+        Config.PUBLIC_RATE_LIMIT,  # Public endpoints rate limit from config
+        Config.PRIVATE_RATE_LIMIT,  # Authenticated endpoints rate limit from config
+        Config.SYMBOLS,  # Monitored symbols batched into ticker requests
+        Config.MAX_RETRY_AFTER  # Retry-After cap from config
     )
+    atexit.register(api_client.close)  # Close pooled connections, workers and the stream once at exit
 
     return api_client
 
 
+def initialize_market_stream(api_client):
+    """
+    Starts the WebSocket market data stream and attaches it to the API client.
+
+    :param api_client: The API client instance
+    :return: market_stream
+    """
+
+    print(
+        f"{BackgroundColors.GREEN}Starting market data stream...{BackgroundColors.RESET}"
+    )  # Output market data stream start message
+
+    from ws_client import create_market_data_stream  # Imported lazily: only needed once the configuration is valid
+
+    market_stream = create_market_data_stream(Config.SYMBOLS, Config.WS_URL, Config.WS_RECONNECT_DELAY)  # Create and start market data stream
+    api_client.attach_market_stream(market_stream, Config.STREAM_MAX_AGE)  # Serve tickers and order books from the stream when fresh
+
+    return market_stream
+
+
 def initialize_account_manager(api_client):
     """
     Initializes the account manager and retrieves the account id.
@@ -194,96 +255,100 @@ def initialize_account_manager(api_client):
     """
 
     print(
-        f"{BackgroundColors.GREEN}Initializing account manager...{Style.RESET_ALL}"
+        f"{BackgroundColors.GREEN}Initializing account manager...{BackgroundColors.RESET}"
     )  # Output account manager initialization message
 
+    from account import create_account_manager  # Imported lazily: only needed once the configuration is valid
+
     account_manager = create_account_manager(api_client)  # Create account manager instance
 
     account_id = account_manager.get_account_id()  # Get account ID
     if not account_id:  # Verify if account ID retrieved
         print(
-            f"{BackgroundColors.RED}Failed to retrieve account ID!{Style.RESET_ALL}"
+            f"{BackgroundColors.RED}Failed to retrieve account ID!{BackgroundColors.RESET}"
         )  # Output failure message
         return None, None  # Exit if account ID not available
 
     print(
-        f"{BackgroundColors.GREEN}Account ID: {BackgroundColors.CYAN}{account_id}{Style.RESET_ALL}"
+        f"{BackgroundColors.GREEN}Account ID: {BackgroundColors.CYAN}{account_id}{BackgroundColors.RESET}"
     )  # Output account ID
 
     return account_manager, account_id
 
 
-def display_account_balances(account_manager):
+def load_startup_data(api_client, account_manager):
     """
-    Retrieves and displays account balances.
+    Retrieves account balances and the average BTC purchase price concurrently.
 
+    :param api_client: The API client instance
     :param account_manager: The account manager instance
-    :return: None
+    :return: tuple(balances, avg_price)
     """
 
     print(
-        f"{BackgroundColors.GREEN}Retrieving account balances...{Style.RESET_ALL}"
-    )  # Output balance retrieval message
-
-    balances = account_manager.get_balances()  # Get account balances
-    if balances:  # Verify if balances retrieved
-        for balance in balances:  # Iterate through balances
-            symbol = balance.get("symbol", "N/A")  # Get symbol
-            available = balance.get("available", "0")  # Get available balance
-            total = balance.get("total", "0")  # Get total balance
-            print(
-                f"{BackgroundColors.CYAN}  {symbol}: {BackgroundColors.YELLOW}Available={available}, Total={total}{Style.RESET_ALL}"
-            )  # Output balance information
+        f"{BackgroundColors.GREEN}Retrieving account balances and average BTC purchase price...{BackgroundColors.RESET}"
+    )  # Output startup data retrieval message
+
+    balances, avg_price = api_client.run_concurrently([  # Run independent startup calls concurrently (wall-clock is the slowest call)
+        (account_manager.get_balance_columns, ()),  # Account balances (column view)
+        (account_manager.calculate_average_price, (Config.CRYPTO, Config.PRIMARY_SYMBOL)),  # Average purchase price
+    ])
+
+    return balances, avg_price
 
 
-def display_average_price(account_manager):
+def display_account_balances(balances):
     """
-    Calculates and displays the average BTC purchase price.
+    Builds the account balances block.
 
-    :param account_manager: The account manager instance
-    :return: avg_price
+    :param balances: Balances column view (or None)
+    :return: Balance lines joined by newlines (empty string if no balances)
     """
 
-    print(
-        f"\n{BackgroundColors.GREEN}Calculating average BTC purchase price...{Style.RESET_ALL}"
-    )  # Output average price calculation message
+    if not balances:  # Verify if balances retrieved
+        return ""  # Return empty block if no balances
 
-    avg_price = account_manager.calculate_average_price(  # Calculate average price
-        Config.CRYPTO,  # Crypto symbol
-        Config.PRIMARY_SYMBOL  # Trading pair
-    )
+    return "\n".join([BALANCE_LINE_TEMPLATE.format(symbol, available, total) for symbol, available, total in zip(balances.symbols, balances.avails, balances.totals)])  # Build all balance lines at once
+
+
+def display_average_price(avg_price):
+    """
+    Builds the average BTC purchase price line.
+
+    :param avg_price: Average purchase price (or None)
+    :return: Formatted average price line
+    """
 
     if avg_price:  # Verify if average price calculated
-        print(
-            f"{BackgroundColors.GREEN}Average BTC price: {BackgroundColors.CYAN}{avg_price:.2f} BRL{Style.RESET_ALL}"
-        )  # Output average price
-    else:  # No average price available
-        print(
-            f"{BackgroundColors.YELLOW}No BTC purchase history found.{Style.RESET_ALL}"
-        )  # Output no history message
+        return f"\n{BackgroundColors.GREEN}Average BTC price: {BackgroundColors.CYAN}{avg_price:.2f} BRL{BackgroundColors.RESET}"  # Return average price line
 
-    return avg_price
+    return f"\n{BackgroundColors.YELLOW}No BTC purchase history found.{BackgroundColors.RESET}"  # Return no history line
 
 
-def initialize_trading_bot(api_client, account_manager, logger):
+def initialize_trading_bot(api_client, account_manager, avg_price=None):
     """
-    Initializes the trading bot instance.
+    Initializes the trading bot instance (its logs are printed to stdout, which is redirected to the Logger).
 
     :param api_client: The API client instance
     :param account_manager: The account manager instance
-    :param logger: The logger instance
+    :param avg_price: The already calculated average purchase price (optional)
     :return: trading_bot
     """
 
     print(
-        f"\n{BackgroundColors.GREEN}Initializing trading bot...{Style.RESET_ALL}"
+        f"\n{BackgroundColors.GREEN}Initializing trading bot...{BackgroundColors.RESET}"
     )  # Output trading bot initialization message
 
+    market_stream = initialize_market_stream(api_client)  # Start the WebSocket price feed
+
+    from trader import create_trading_bot  # Imported lazily: only needed once the configuration is valid
+
     trading_bot = create_trading_bot(  # Create trading bot instance
         api_client,  # API client instance
         account_manager,  # Account manager instance
         Config,  # Configuration
-        logger  # Logger instance
+        market_stream=market_stream,  # Market data stream instance
+        average_price=avg_price,  # Average price calculated at startup
     )
 
     return trading_bot
@@ -291,53 +356,60 @@ def initialize_trading_bot(api_client, account_manager, logger):
 
 def display_trading_rules():
     """
-    Displays configured trading rules.
+    Returns the configured trading rules block.
 
     :param: None
-    :return: None
+    :return: Precomputed trading rules block
     """
 
-    print(
-        f"{BackgroundColors.GREEN}Trading rules configured:{Style.RESET_ALL}"
-    )  # Output trading rules header
-    print(
-        f"{BackgroundColors.CYAN}  BUY 10% of BRL when price is 10% above average{Style.RESET_ALL}"
-    )  # Output buy rule 1
-    print(
-        f"{BackgroundColors.CYAN}  BUY 20% of BRL when price is 20% above average{Style.RESET_ALL}"
-    )  # Output buy rule 2
-    print(
-        f"{BackgroundColors.CYAN}  BUY 50% of BRL when price is 25% above average{Style.RESET_ALL}"
-    )  # Output buy rule 3
-    print(
-        f"{BackgroundColors.CYAN}  SELL 20% of BTC when price is 100% above average (double){Style.RESET_ALL}"
-    )  # Output sell rule
+    return TRADING_RULES_BLOCK  # Return precomputed trading rules block
 
 
 def start_trading_bot(trading_bot):
     """
-    Starts the trading bot loop and handles interrupts and errors.
+    Starts the trading bot loop and stops it on Ctrl+C, termination signals and errors.
 
     :param trading_bot: The trading bot instance
     :return: None
     """
 
     print(
-        f"\n{BackgroundColors.BOLD}{BackgroundColors.GREEN}Starting trading bot... (Press Ctrl+C to stop){Style.RESET_ALL}\n"
+        f"\n{BackgroundColors.BOLD}{BackgroundColors.GREEN}Starting trading bot... (Press Ctrl+C to stop){BackgroundColors.RESET}\n"
     )  # Output bot start message
 
+    received_signals = []  # Signals received while running (appended by the handler, reported by the main thread)
+
+    def handle_stop_signal(signum, frame):
+        """
+        Signals the trading bot to stop.
+
+        Runs between bytecodes of the main thread, so it must not print or log: both go through
+        queues whose locks the interrupted code may be holding.
+
+        :param signum: Received signal number
+        :param frame: Current stack frame
+        :return: None
+        """
+
+        received_signals.append(signum)  # Record the signal for the main thread
+        trading_bot.request_stop()  # Only set the stop event and close the stream
+
+    signal.signal(signal.SIGINT, handle_stop_signal)  # Stop on Ctrl+C
+    signal.signal(signal.SIGTERM, handle_stop_signal)  # Stop on termination request
+
     try:  # Attempt to run trading bot
-        trading_bot.run()  # Start trading bot main loop
-    except KeyboardInterrupt:  # Handle keyboard interrupt
-        print(
-            f"\n{BackgroundColors.YELLOW}Keyboard interrupt received. Stopping bot...{Style.RESET_ALL}"
-        )  # Output interrupt message
-        trading_bot.stop()  # Stop trading bot
+        trading_bot.run()  # Start trading bot main loop (returns once the stop event is set)
+        if received_signals:  # Verify if the loop ended because of a stop signal
+            print(
+                f"\n{BackgroundColors.YELLOW}Stop signal received. Stopping bot...{BackgroundColors.RESET}"
+            )  # Output interrupt message from the main thread
     except Exception as e:  # Catch any other exceptions
         print(
-            f"\n{BackgroundColors.RED}Error occurred: {str(e)}{Style.RESET_ALL}"
+            f"\n{BackgroundColors.RED}Error occurred: {str(e)}{BackgroundColors.RESET}"
         )  # Output error message
-        trading_bot.stop()  # Stop trading bot
+        traceback.print_exc()  # Output the full traceback for post-mortem analysis
+    finally:  # Always shut down exactly once
+        trading_bot.stop()  # Stop trading bot and log it (a signal only requested the stop)
 
 
 def verify_filepath_exists(filepath):
@@ -349,24 +421,26 @@ def verify_filepath_exists(filepath):
     """
 
     verbose_output(
-        f"{BackgroundColors.GREEN}Verifying if the file or folder exists at the path: {BackgroundColors.CYAN}{filepath}{Style.RESET_ALL}"
+        f"{BackgroundColors.GREEN}Verifying if the file or folder exists at the path: {BackgroundColors.CYAN}{filepath}{BackgroundColors.RESET}"
     )  # Output the verbose message
 
     return os.path.exists(filepath)  # Return True if the file or folder exists, False otherwise
 
 
+@functools.singledispatch  # Dispatch on the argument type instead of probing attributes
 def to_seconds(obj):
     """
     Converts various time-like objects to seconds.
     
+    Registered types (int, float, timedelta, datetime) are handled by type dispatch;
+    this base implementation only handles None and other duck-typed objects.
+    
     :param obj: The object to convert (can be int, float, timedelta, datetime, etc.)
     :return: The equivalent time in seconds as a float, or None if conversion fails
     """
     
     if obj is None:  # None can't be converted
         return None  # Signal failure to convert
-    if isinstance(obj, (int, float)):  # Already numeric (seconds or timestamp)
-        return float(obj)  # Return as float seconds
     if hasattr(obj, "total_seconds"):  # Timedelta-like objects
         try:  # Attempt to call total_seconds()
             return float(obj.total_seconds())  # Use the total_seconds() method
@@ -380,18 +454,58 @@ def to_seconds(obj):
     return None  # Couldn't convert
 
 
+@to_seconds.register(int)  # Numeric seconds or timestamp
+@to_seconds.register(float)  # Numeric seconds or timestamp
+def numeric_to_seconds(obj):
+    """
+    Converts numeric seconds to float seconds.
+    
+    :param obj: The number of seconds
+    :return: The seconds as a float
+    """
+    
+    return float(obj)  # Return as float seconds
+
+
+@to_seconds.register(datetime.timedelta)  # Durations
+def timedelta_to_seconds(obj):
+    """
+    Converts a timedelta to seconds.
+    
+    :param obj: The timedelta
+    :return: The total seconds as a float
+    """
+    
+    return obj.total_seconds()  # Use the total_seconds() method
+
+
+@to_seconds.register(datetime.datetime)  # Points in time
+def datetime_to_seconds(obj):
+    """
+    Converts a datetime to seconds since epoch.
+    
+    :param obj: The datetime
+    :return: The timestamp as a float
+    """
+    
+    return obj.timestamp()  # Use timestamp() to get seconds since epoch
+
+
 def calculate_execution_time(start_time, finish_time=None):
     """
     Calculates the execution time and returns a human-readable string.
 
     Accepts either:
     - Two datetimes/timedeltas: `calculate_execution_time(start, finish)`
-    - A single timedelta or numeric seconds: `calculate_execution_time(delta)`
-    - Two numeric timestamps (seconds): `calculate_execution_time(start_s, finish_s)`
+    - A single timedelta or numeric seconds, e.g. a monotonic clock delta: `calculate_execution_time(time.monotonic() - start)`
+    - Two numeric timestamps (seconds), e.g. monotonic readings: `calculate_execution_time(start_s, finish_s)`
 
     Returns a string like "1h 2m 3s".
     """
 
+    if type(start_time) is datetime.datetime and type(finish_time) is datetime.datetime:  # Verify if both are plain datetimes (the common case)
+        return format_duration((finish_time - start_time).total_seconds())  # Fast path: subtract directly and skip conversions
+
     if finish_time is None:  # Single-argument mode: start_time already represents duration or seconds
         total_seconds = to_seconds(start_time)  # Try to convert provided value to seconds
         if total_seconds is None:  # Conversion failed
@@ -419,10 +533,20 @@ def calculate_execution_time(start_time, finish_time=None):
     if total_seconds < 0:  # Normalize negative durations
         total_seconds = abs(total_seconds)  # Use absolute value
 
-    days = int(total_seconds // 86400)  # Compute full days
-    hours = int((total_seconds % 86400) // 3600)  # Compute remaining hours
-    minutes = int((total_seconds % 3600) // 60)  # Compute remaining minutes
-    seconds = int(total_seconds % 60)  # Compute remaining seconds
+    return format_duration(total_seconds)  # Return formatted duration
+
+
+def format_duration(total_seconds):
+    """
+    Formats a duration in seconds as a human-readable string like "1h 2m 3s".
+
+    :param total_seconds: The duration in seconds
+    :return: The formatted duration string
+    """
+
+    days, remainder = divmod(int(total_seconds), 86400)  # Compute full days and remaining seconds
+    hours, remainder = divmod(remainder, 3600)  # Compute remaining hours
+    minutes, seconds = divmod(remainder, 60)  # Compute remaining minutes and seconds
 
     if days > 0:  # Include days when present
         return f"{days}d {hours}h {minutes}m {seconds}s"  # Return formatted days+hours+minutes+seconds
@@ -441,20 +565,24 @@ def play_sound():
     :return: None
     """
 
-    current_os = platform.system()  # Get the current operating system
+    current_os = CURRENT_OS  # Get the current operating system
     if current_os == "Windows":  # If the current operating system is Windows
         return  # Do nothing
 
-    if verify_filepath_exists(SOUND_FILE):  # If the sound file exists
+    if SOUND_FILE_EXISTS:  # If the sound file exists
         if current_os in SOUND_COMMANDS:  # If the platform.system() is in the SOUND_COMMANDS dictionary
-            os.system(f"{SOUND_COMMANDS[current_os]} {SOUND_FILE}")  # Play the sound
+            subprocess.Popen(  # Play the sound without waiting for playback or spawning a shell
+                [SOUND_COMMANDS[current_os], SOUND_FILE],  # Command and sound file as arguments
+                stdout=subprocess.DEVNULL,  # Discard player output
+                stderr=subprocess.DEVNULL,  # Discard player errors
+            )
         else:  # If the platform.system() is not in the SOUND_COMMANDS dictionary
             print(
-                f"{BackgroundColors.RED}The {BackgroundColors.CYAN}{current_os}{BackgroundColors.RED} is not in the {BackgroundColors.CYAN}SOUND_COMMANDS dictionary{BackgroundColors.RED}. Please add it!{Style.RESET_ALL}"
+                f"{BackgroundColors.RED}The {BackgroundColors.CYAN}{current_os}{BackgroundColors.RED} is not in the {BackgroundColors.CYAN}SOUND_COMMANDS dictionary{BackgroundColors.RED}. Please add it!{BackgroundColors.RESET}"
             )
     else:  # If the sound file does not exist
         print(
-            f"{BackgroundColors.RED}Sound file {BackgroundColors.CYAN}{SOUND_FILE}{BackgroundColors.RED} not found. Make sure the file exists.{Style.RESET_ALL}"
+            f"{BackgroundColors.RED}Sound file {BackgroundColors.CYAN}{SOUND_FILE}{BackgroundColors.RED} not found. Make sure the file exists.{BackgroundColors.RESET}"
         )
 
 
@@ -467,21 +595,22 @@ def main():
     """
 
     print(
-        f"{BackgroundColors.CLEAR_TERMINAL}{BackgroundColors.BOLD}{BackgroundColors.GREEN}Welcome to the {BackgroundColors.CYAN}Mercado Bitcoin Trading Bot{BackgroundColors.GREEN} program!{Style.RESET_ALL}",
+        f"{BackgroundColors.CLEAR_TERMINAL}{BackgroundColors.BOLD}{BackgroundColors.GREEN}Welcome to the {BackgroundColors.CYAN}Mercado Bitcoin Trading Bot{BackgroundColors.GREEN} program!{BackgroundColors.RESET}",
         end="\n\n",
     )  # Output the welcome message
-    start_time = datetime.datetime.now()  # Get the start time of the program
+    start_time = datetime.datetime.now()  # Get the start time of the program (for display)
+    start_monotonic = time.monotonic()  # Get the start time on the monotonic clock (for the duration)
 
     verbose_output(
-        f"{BackgroundColors.GREEN}Validating configuration...{Style.RESET_ALL}"
+        f"{BackgroundColors.GREEN}Validating configuration...{BackgroundColors.RESET}"
     )  # Output configuration validation message
 
     if not validate_config():  # Verify if configuration is valid
         print(
-            f"{BackgroundColors.RED}Configuration validation failed!{Style.RESET_ALL}"
+            f"{BackgroundColors.RED}Configuration validation failed!{BackgroundColors.RESET}"
         )  # Output error message
         print(
-            f"{BackgroundColors.RED}Please set MB_API_KEY and MB_API_SECRET environment variables.{Style.RESET_ALL}"
+            f"{BackgroundColors.RED}Please set MB_API_KEY and MB_API_SECRET environment variables.{BackgroundColors.RESET}"
         )  # Output instructions
         return  # Exit if configuration invalid
 
@@ -497,26 +626,28 @@ def main():
     if not account_id:  # Verify if account ID retrieved
         return  # Exit if account ID not available
 
-    display_account_balances(account_manager)  # Show account balances
-
-    avg_price = display_average_price(account_manager)  # Calculate and display average price
+    balances, avg_price = load_startup_data(api_client, account_manager)  # Fetch balances and average price concurrently
 
-    trading_bot = initialize_trading_bot(api_client, account_manager, logger)  # Initialize trading bot
+    startup_blocks = [display_account_balances(balances), display_average_price(avg_price), display_trading_rules()]  # Build startup summary blocks
+    sys.stdout.write("\n".join([block for block in startup_blocks if block]) + "\n")  # Output the whole startup summary in one write
+    sys.stdout.flush()  # Flush the startup summary once
 
-    display_trading_rules()  # Show trading rules
+    trading_bot = initialize_trading_bot(api_client, account_manager, avg_price)  # Initialize trading bot with the startup average price
 
     start_trading_bot(trading_bot)  # Start the trading bot loop
 
-    finish_time = datetime.datetime.now()  # Get the finish time of the program
+    finish_time = datetime.datetime.now()  # Get the finish time of the program (for display)
+    execution_time = calculate_execution_time(start_monotonic, time.monotonic())  # Elapsed time on the monotonic clock (immune to wall clock changes)
     print(
-        f"\n{BackgroundColors.GREEN}Start time: {BackgroundColors.CYAN}{start_time.strftime('%d/%m/%Y - %H:%M:%S')}\n{BackgroundColors.GREEN}Finish time: {BackgroundColors.CYAN}{finish_time.strftime('%d/%m/%Y - %H:%M:%S')}\n{BackgroundColors.GREEN}Execution time: {BackgroundColors.CYAN}{calculate_execution_time(start_time, finish_time)}{Style.RESET_ALL}"
+        TIMING_TEMPLATE.format(  # Fill precomputed timing template
+            start=start_time.strftime(TIMESTAMP_FORMAT),  # Start timestamp
+            finish=finish_time.strftime(TIMESTAMP_FORMAT),  # Finish timestamp
+            elapsed=execution_time,  # Execution time
+        )
     )  # Output the start and finish times
     print(
-        f"\n{BackgroundColors.BOLD}{BackgroundColors.GREEN}Program finished.{Style.RESET_ALL}"
+        f"\n{BackgroundColors.BOLD}{BackgroundColors.GREEN}Program finished.{BackgroundColors.RESET}"
     )  # Output the end of the program message
-    (
-        atexit.register(play_sound) if RUN_FUNCTIONS["Play Sound"] else None
-    )  # Register the play_sound function to be called when the program finishes
 
 
 if __name__ == "__main__":
@@ -526,4 +657,7 @@ if __name__ == "__main__":
     :return: None
     """
 
+    if RUN_FUNCTIONS["Play Sound"]:  # If the sound is enabled
+        atexit.register(play_sound)  # Register the play_sound function once at startup, so it also runs on early exits
+
     main()  # Call the main function
@@ -10,7 +10,9 @@ Description :
     and executes buy/sell orders based on predefined thresholds.
 
     Key features include:
-        - Real-time price monitoring
+        - Real-time price monitoring from a WebSocket price feed (REST fallback)
+        - Shared short-lived price snapshots with single-flight fetching
+        - Concurrent per-cycle fetch of price, average price and balances
         - Rule-based trading decision engine
         - Automatic order execution
         - Duplicate execution prevention
@@ -38,37 +40,332 @@ TODOs:
 
 Dependencies:
     - Python >= 3.8
+    - bisect (standard library)
+    - logging (standard library)
+    - math (standard library)
+    - mmap (standard library)
+    - os (standard library)
+    - threading (standard library)
     - time (standard library)
     - typing (standard library)
 
 Assumptions & Notes:
-    - Rules are evaluated on each monitoring cycle
+    - Rules are evaluated on each streamed ticker update, or every
+      VERIFICATION_INTERVAL seconds when no update arrives
     - Only one rule per price level is executed
+    - At most one order is placed per cycle (the highest reached buy tier or
+      the sell rule), so orders are never submitted in batches
+    - Executed rules are tracked per log-scale average price bucket
+      (AVERAGE_PRICE_BUCKET wide), so small average drift does not reset them
     - Balances are verified before each trade
-    - Average price is recalculated after each buy
+    - Each cycle fetches its inputs (price, average price and balances)
+      concurrently in get_tick_snapshot, over APIClient.run_concurrently
+    - Average price is recalculated after each buy (version bump) and at
+      least every AVERAGE_PRICE_MAX_AGE seconds (to pick up outside trades)
+    - Prices come from the market data stream while fresh, REST otherwise
+      (a stale stream is also reconnected)
+    - Orders are skipped when the price is older than MAX_PRICE_AGE seconds
+      by the time the order would be placed
+    - request_stop() may be called from any thread or a signal handler (it
+      neither logs nor prints); stop() logs and is meant for normal code
+    - A rule with an order in flight cannot be submitted again concurrently
+    - Executed rules persist across restarts in a memory-mapped file
+      (EXECUTED_RULES_PATH), opened when the bot starts running; its header
+      holds the symbol and a hash of the rule set, and the file is reset
+      when either changes
+    - Trading logs go through the "trader" logging logger, configured once at
+      import; records are printed to stdout, which main.py redirects to the
+      Logger, so a log call only enqueues the text for Logger's writer thread
 """
 
-import time  # For monitoring intervals and timing
-from typing import Dict, Optional, Set  # For type hints
+import hashlib  # For the rule set hash in the executed rules file header
+import logging  # For trading logs
+import math  # For log-scale average price buckets
+import mmap  # For the memory-mapped executed rules file
+import os  # For opening the executed rules file
+import threading  # For the stop signal shared with other threads
+import time  # For price snapshot timestamps
+from bisect import bisect_right  # For locating the reached buy threshold
+from typing import Callable, Dict, NamedTuple, Optional, Tuple  # For type hints
 
 
-class TradingBot:
+# Logging Constants:
+TRADE_LOGGER_NAME = "trader"  # Name of the trading logger
+
+# Executed Rules Store Constants:
+EXECUTED_RULES_BUCKETS = 8192  # Buckets (one byte of rule bits each) in the executed rules file, centered on bucket 0 (average price 1)
+EXECUTED_RULES_MAGIC = b"MBRULES\x01"  # Executed rules file format marker
+EXECUTED_RULES_SYMBOL_SIZE = 24  # Bytes reserved for the symbol in the file header
+EXECUTED_RULES_HEADER_SIZE = len(EXECUTED_RULES_MAGIC) + EXECUTED_RULES_SYMBOL_SIZE + hashlib.sha256().digest_size  # Magic, symbol and rule set hash
+
+# Rule Key Constants:
+BUY_RULE_PREFIX = "buy_"  # Readable buy rule keys look like buy_<tier>_<average price bucket>
+SELL_RULE_PREFIX = "sell_"  # Readable sell rule keys look like sell_<average price bucket>
+
+
+class StdoutHandler(logging.Handler):
     """
-    Implements automated trading logic and execution.
+    Prints formatted records to the current sys.stdout (which main.py redirects to the Logger), exactly like print().
+    
+    :param: None
+    :return: None
+    """
+
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Prints a record, producing the same output as print(message).
+        
+        :param record: Log record
+        :return: None
+        """
+        
+        try:  # Attempt to write record
+            print(self.format(record))  # Same writes as the previous print-based log
+        except Exception:  # Handle write failures
+            self.handleError(record)  # Report through logging error handling
+
+
+class TickSnapshot(NamedTuple):
+    """
+    Inputs of one monitoring cycle, fetched concurrently.
+    
+    :param price: Current market price (or None)
+    :param average_price: Average purchase price (or None)
+    :param available_fiat: Available fiat balance (None if balances could not be fetched)
+    :param available_crypto: Available crypto balance (None if balances could not be fetched)
+    :param price_at: Monotonic time the price was produced (stream receive time or REST request time, 0.0 if unavailable)
+    """
+    
+    price: Optional[float]  # Current market price
+    average_price: Optional[float]  # Average purchase price
+    available_fiat: Optional[float]  # Available fiat balance
+    available_crypto: Optional[float]  # Available crypto balance
+    price_at: float  # Monotonic time the price was produced
+
+
+class PriceCache:
+    """
+    Shares one price snapshot per symbol between all readers within a short window.
+    
+    Concurrent readers of a stale symbol wait for a single fetch instead of each
+    triggering their own (single-flight).
+    
+    :param: None
+    :return: None
+    """
+
+
+    def __init__(self, fetch: Callable[[str], Optional[Tuple[float, float]]], max_age: float):
+        """
+        Initializes the PriceCache.
+        
+        :param fetch: Function returning (monotonic price time, price) for a symbol (or None)
+        :param max_age: Seconds a fetched price is shared with other readers
+        :return: None
+        """
+        
+        self.fetch = fetch  # Store price fetch function
+        self.max_age = max_age  # Store snapshot window
+        self.snapshots: Dict[str, Tuple[float, float, float]] = {}  # Latest (fetch time, price time, price) per symbol
+        self.fetch_locks: Dict[str, threading.Lock] = {}  # One in-flight fetch lock per symbol
+        self.locks_guard = threading.Lock()  # Protects creation of per-symbol locks
+
+
+    def get(self, symbol: str) -> Optional[float]:
+        """
+        Returns the price snapshot for a symbol, fetching it once when stale.
+        
+        :param symbol: Trading pair symbol (e.g., BTC-BRL)
+        :return: Price as float or None if unavailable
+        """
+        
+        timed = self.get_timed(symbol)  # Get price with its time
+        return timed[1] if timed is not None else None  # Return price only
+
+
+    def get_timed(self, symbol: str) -> Optional[Tuple[float, float]]:
+        """
+        Returns the price snapshot for a symbol with the time the price was produced, fetching it once when stale.
+        
+        :param symbol: Trading pair symbol (e.g., BTC-BRL)
+        :return: Tuple of (monotonic price time, price) or None if unavailable
+        """
+        
+        snapshot = self.snapshots.get(symbol)  # Get current snapshot
+        if snapshot is not None and time.monotonic() - snapshot[0] < self.max_age:  # Verify if snapshot is fresh
+            return snapshot[1:]  # Return shared price with its time
+        
+        lock = self.fetch_locks.get(symbol)  # Get fetch lock for the symbol
+        if lock is None:  # Verify if lock does not exist yet
+            with self.locks_guard:  # Create lock at most once
+                lock = self.fetch_locks.setdefault(symbol, threading.Lock())  # Get or create fetch lock
+        
+        with lock:  # Only one reader fetches, the others wait for its result
+            snapshot = self.snapshots.get(symbol)  # Re-read snapshot (another reader may have fetched it)
+            if snapshot is not None and time.monotonic() - snapshot[0] < self.max_age:  # Verify if snapshot became fresh
+                return snapshot[1:]  # Return shared price with its time
+            
+            timed = self.fetch(symbol)  # Fetch price once for all waiting readers
+            if timed is not None:  # Verify if price retrieved
+                self.snapshots[symbol] = (time.monotonic(),) + tuple(timed)  # Store snapshot
+            return timed  # Return fetched price with its time
+
+
+class ExecutedRulesStore:
+    """
+    Persists executed rule bits in a memory-mapped file, one byte per average price bucket.
+    
+    Setting a bit is a single byte write into the mapping; the OS writes pages back on its
+    own schedule and flush() is only called after an order fill. The header identifies the
+    symbol and rule set the bits belong to; a file written for others is reset on open.
+    Buckets are stored with an offset of half the size, so averages below 1 (negative
+    buckets) fit as well.
     
     :param: None
     :return: None
     """
 
 
-    def __init__(self, api_client, account_manager, config, logger=None):
+    def __init__(self, path: str, symbol: str, rules: Tuple, size: int = EXECUTED_RULES_BUCKETS):
+        """
+        Initializes the ExecutedRulesStore, creating, sizing or resetting the file if needed.
+        
+        :param path: Path of the executed rules file
+        :param symbol: Trading pair symbol the rules are executed on
+        :param rules: Rule set definition (any repr-stable tuple), hashed into the header
+        :param size: Number of buckets (bytes) in the file
+        :return: None
+        """
+        
+        self.path = path  # Store file path
+        self.size = size  # Store number of buckets
+        self.offset = size // 2  # File index of bucket 0
+        file_size = EXECUTED_RULES_HEADER_SIZE + size  # Header followed by the buckets
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)  # Open or create the file
+        try:  # Map the file, always closing the descriptor (the mapping keeps its own)
+            if os.fstat(fd).st_size < file_size:  # Verify if the file is smaller than the mapping
+                os.ftruncate(fd, file_size)  # Grow the file with zero bytes
+            self.buffer = mmap.mmap(fd, file_size)  # Map the header and buckets into memory
+        finally:  # Descriptor no longer needed
+            os.close(fd)  # Close descriptor
+        
+        header = EXECUTED_RULES_MAGIC + symbol.encode()[:EXECUTED_RULES_SYMBOL_SIZE].ljust(EXECUTED_RULES_SYMBOL_SIZE, b"\0") + hashlib.sha256(repr(rules).encode()).digest()  # Expected header
+        current = self.buffer[:EXECUTED_RULES_HEADER_SIZE]  # Header found in the file
+        self.reset = current != header and any(current)  # Whether bits of another symbol or rule set are discarded
+        if current != header:  # Verify if the file is new or belongs to another symbol or rule set
+            self.buffer[:] = bytes(file_size)  # Discard the bits, they do not mean the same rules
+            self.buffer[:EXECUTED_RULES_HEADER_SIZE] = header  # Write the header
+            self.buffer.flush()  # Persist the reset
+        
+        if hasattr(self.buffer, "madvise") and hasattr(mmap, "MADV_RANDOM"):  # Verify if access hints are supported (Python >= 3.8 on Unix)
+            self.buffer.madvise(mmap.MADV_RANDOM)  # Buckets are accessed at random, skip read-ahead
+
+
+    def load(self) -> Dict[int, int]:
+        """
+        Returns the executed rule bits of every bucket that has any.
+        
+        :param: None
+        :return: Dictionary mapping bucket to rule bits
+        """
+        
+        return {index - self.offset: bits for index, bits in enumerate(self.buffer[EXECUTED_RULES_HEADER_SIZE:]) if bits}  # Copy non-empty buckets
+
+
+    def set_bits(self, bucket: int, bits: int) -> bool:
+        """
+        Sets rule bits for a bucket and flushes the change to the file.
+        
+        :param bucket: Average price bucket
+        :param bits: Rule bits to set
+        :return: True if stored, False if the bucket or bits do not fit in the file
+        """
+        
+        index = bucket + self.offset  # Bucket index in the file
+        if not 0 <= index < self.size or bits > 0xFF:  # Verify if bucket and bits fit in a byte of the file
+            return False  # Not persisted (kept in memory only)
+        position = EXECUTED_RULES_HEADER_SIZE + index  # Byte position after the header
+        self.buffer[position] = self.buffer[position] | bits  # Set bits with a single byte write
+        self.buffer.flush()  # Write the change back after the fill
+        return True  # Stored
+
+
+    def close(self) -> None:
+        """
+        Flushes and unmaps the file.
+        
+        :param: None
+        :return: None
+        """
+        
+        self.buffer.flush()  # Write pending changes
+        self.buffer.close()  # Unmap file
+
+
+class TradingBot:
+    """
+    Implements automated trading logic and execution.
+    
+    :param: None
+    :return: None
+    """
+    
+    __slots__ = (  # Fixed attribute layout, avoids a per-instance __dict__
+        "api_client",  # API client instance
+        "account_manager",  # Account manager instance
+        "config",  # Configuration object
+        "logger",  # Logger instance
+        "log",  # Log function
+        "log_every_tick",  # Verbose per-cycle logs flag
+        "executed_mask",  # Executed rule bits per average price bucket
+        "inflight_mask",  # In-flight rule bits per average price bucket
+        "order_lock",  # Rule claim lock
+        "current_average_price",  # Cached average price
+        "average_price_version",  # Average price invalidation counter
+        "average_price_key",  # (version, calculation time) of the cached average price
+        "buy_rules_ascending",  # Buy rules sorted by threshold
+        "buy_thresholds",  # Sorted buy thresholds
+        "sell_rule_bit",  # Sell rule bit
+        "sell_threshold",  # Sell threshold
+        "sell_amount",  # Sell amount
+        "symbol",  # Trading pair
+        "fiat",  # Fiat currency symbol
+        "crypto",  # Cryptocurrency symbol
+        "verification_interval",  # Fallback polling period
+        "stream_max_age",  # Streamed data staleness limit
+        "average_price_max_age",  # Average price reuse window
+        "max_price_age",  # Price age limit for orders
+        "bucket_log_step",  # Log width of an average price bucket
+        "stream_reset_at",  # Last stale stream reset time
+        "trigger_average",  # Average price of the trigger prices
+        "buy_trigger_prices",  # Absolute buy trigger prices
+        "sell_trigger_price",  # Absolute sell trigger price
+        "lowest_trigger_price",  # Lowest absolute trigger price
+        "average_bucket",  # Average price bucket
+        "is_running",  # Running state
+        "market_stream",  # WebSocket market data stream
+        "stop_event",  # Stop signal
+        "stopped",  # Whether stop() already ran
+        "price_cache",  # Shared price snapshots
+        "rules_store",  # Executed rules persistence
+        "rules_store_path",  # Executed rules file path
+        "rules_loaded",  # Whether executed rules were restored
+    )
+
+
+    def __init__(self, api_client, account_manager, config, logger=None, market_stream=None, average_price: Optional[float] = None, price_cache: Optional[PriceCache] = None, rules_store: Optional[ExecutedRulesStore] = None):
         """
         Initializes the TradingBot.
         
         :param api_client: APIClient instance for API operations
         :param account_manager: AccountManager instance for account operations
         :param config: Configuration object containing trading rules
-        :param logger: Optional logger for output
+        :param logger: Optional logging.Logger (anything with an info method) receiving the logs (defaults to the "trader" logger)
+        :param market_stream: Optional MarketDataStream providing pushed prices
+        :param average_price: Optional already calculated average purchase price
+        :param price_cache: Optional shared PriceCache (one is created if omitted)
+        :param rules_store: Optional ExecutedRulesStore (opened from config.EXECUTED_RULES_PATH when the bot starts if omitted)
         :return: None
         """
         
@@ -76,34 +373,88 @@ class TradingBot:
         self.account_manager = account_manager  # Store account manager instance
         self.config = config  # Store configuration
         self.logger = logger  # Store logger instance
-        self.executed_rules: Set[str] = set()  # Track executed rules to prevent duplicates
-        self.current_average_price: Optional[float] = None  # Cache current average price
+        self.log = logger.info if logger is not None else TRADE_LOGGER.info  # Log function: injected logger, or the module logger (configured once at import)
+        self.log_every_tick = config.LOG_EVERY_TICK  # Whether per-cycle price logs are emitted
+        self.executed_mask: Dict[int, int] = {}  # Executed rule bits per average price bucket (prevents duplicates)
+        self.inflight_mask: Dict[int, int] = {}  # Rule bits with an order being submitted, per average price bucket
+        self.order_lock = threading.Lock()  # Protects the executed and in-flight rule bits while claiming a rule
+        self.current_average_price: Optional[float] = average_price  # Cache current average price (seeded when already known)
+        self.average_price_version = 0  # Bumped whenever a fill may change the average price
+        self.average_price_key: Optional[Tuple[int, float]] = (0, time.monotonic()) if average_price is not None else None  # (version, calculation time) of the cached average price
+        self.buy_rules_ascending = tuple(sorted(config.RULES.BTC_BUY_RULES))  # Buy rules sorted from lowest to highest threshold
+        self.buy_thresholds = tuple(threshold for threshold, _ in self.buy_rules_ascending)  # Sorted buy thresholds for bisection
+        self.sell_rule_bit = 1 << len(self.buy_rules_ascending)  # Buy tier N uses bit N - 1, the sell rule uses the next bit
+        self.sell_threshold = config.RULES.BTC_SELL_THRESHOLD  # Sell threshold
+        self.sell_amount = config.RULES.BTC_SELL_AMOUNT  # Sell amount
+        self.symbol = config.PRIMARY_SYMBOL  # Trading pair
+        self.fiat = config.FIAT  # Fiat currency symbol
+        self.crypto = config.CRYPTO  # Cryptocurrency symbol
+        self.verification_interval = config.VERIFICATION_INTERVAL  # Fallback polling period in seconds
+        self.stream_max_age = config.STREAM_MAX_AGE  # Maximum accepted streamed data age
+        self.average_price_max_age = config.AVERAGE_PRICE_MAX_AGE  # Average price reuse window
+        self.max_price_age = config.MAX_PRICE_AGE  # Maximum price age when placing an order
+        self.bucket_log_step = math.log1p(config.AVERAGE_PRICE_BUCKET)  # Log width of one average price bucket
+        self.stream_reset_at = time.monotonic()  # Monotonic time of the last stale stream reset (construction counts, so a connecting stream is not reset)
+        self.trigger_average: Optional[float] = None  # Average price the trigger prices below were computed for
+        self.buy_trigger_prices: Tuple[float, ...] = ()  # Absolute buy trigger prices, lowest first
+        self.sell_trigger_price = 0.0  # Absolute sell trigger price
+        self.lowest_trigger_price = 0.0  # Below this price no rule can fire
+        self.average_bucket = 0  # Average price bucket of the rules
         self.is_running = False  # Bot running state
+        self.market_stream = market_stream  # Optional WebSocket market data stream
+        self.stop_event = threading.Event()  # Stop signal for the main loop
+        self.stopped = False  # Whether stop() already ran
+        self.price_cache = price_cache if price_cache is not None else PriceCache(self.fetch_last_price, config.PRICE_CACHE_MAX_AGE)  # Shared price snapshots
+        self.rules_store = rules_store  # Executed rules persistence (opened lazily, None if disabled)
+        self.rules_store_path = config.EXECUTED_RULES_PATH  # Executed rules file path (empty disables persistence)
+        self.rules_loaded = False  # Executed rules are restored before the first cycle
 
 
-    def log(self, message: str) -> None:
+    def load_executed_rules(self) -> None:
         """
-        Logs a message if logger is available.
+        Opens the executed rules file (unless a store was given) and restores the rules executed before a restart.
         
-        :param message: Message to log
+        :param: None
         :return: None
         """
         
-        if self.logger:  # Verify if logger exists
-            print(message)  # Print message (redirected to logger via stdout)
-        else:  # No logger available
-            print(message)  # Print to console
+        self.rules_loaded = True  # Only attempt once
+        if self.rules_store is None:  # Verify if no store was given
+            self.rules_store = self.open_rules_store(self.rules_store_path)  # Open the file
+        if self.rules_store is not None:  # Verify if executed rules are persisted
+            self.executed_mask.update(self.rules_store.load())  # Restore rules executed before a restart
+
+
+    def open_rules_store(self, path: str) -> Optional[ExecutedRulesStore]:
+        """
+        Opens the executed rules file, running without persistence if it is disabled or unavailable.
+        
+        :param path: Path of the executed rules file (empty disables persistence)
+        :return: ExecutedRulesStore instance or None
+        """
+        
+        if not path:  # Verify if persistence is disabled
+            return None  # Keep executed rules in memory only
+        rules = (self.config.AVERAGE_PRICE_BUCKET, self.buy_rules_ascending, self.sell_threshold, self.sell_amount)  # Everything that defines the bucket and bit layout
+        try:  # Attempt to open the file
+            store = ExecutedRulesStore(path, self.symbol, rules)  # Open store
+        except (OSError, ValueError) as e:  # Handle unusable file
+            self.log(f"Executed rules will not persist ({path}): {e}")  # Log persistence failure
+            return None  # Keep executed rules in memory only
+        if store.reset:  # Verify if stored bits were discarded
+            self.log(f"Executed rules file {path} belonged to another symbol or rule set, starting empty")  # Log reset
+        return store  # Return store
 
 
     def get_current_price(self, symbol: str) -> Optional[float]:
         """
-        Retrieves current market price for a symbol.
+        Retrieves current market price for a symbol from a new (uncached) REST ticker request.
         
         :param symbol: Trading pair symbol (e.g., BTC-BRL)
         :return: Current price as float or None if failed
         """
         
-        ticker = self.api_client.get_ticker(symbol)  # Get ticker data
+        ticker = self.api_client.get_ticker(symbol, use_stream=False, cache_ttl=0.0)  # Request ticker data (not from the stream or the response cache)
         if ticker:  # Verify if ticker retrieved
             last_price = ticker.get("last")  # Get last traded price
             if last_price:  # Verify if price exists
@@ -114,6 +465,61 @@ class TradingBot:
         return None  # Return None if ticker not available
 
 
+    def fetch_rest_price(self, symbol: str) -> Optional[Tuple[float, float]]:
+        """
+        Requests the current price from REST, timestamped with the request start (an upper bound on its age).
+        
+        :param symbol: Trading pair symbol (e.g., BTC-BRL)
+        :return: Tuple of (monotonic request time, price) or None if unavailable
+        """
+        
+        requested_at = time.monotonic()  # The price cannot be older than the request
+        price = self.get_current_price(symbol)  # Request price
+        return (requested_at, price) if price is not None else None  # Return timed price
+
+
+    def get_last_price(self, symbol: str) -> Optional[float]:
+        """
+        Returns the shared price snapshot for a symbol, so simultaneous readers see the same price.
+        
+        :param symbol: Trading pair symbol (e.g., BTC-BRL)
+        :return: Last price as float or None if unavailable
+        """
+        
+        return self.price_cache.get(symbol)  # Read (or fetch once) the shared snapshot
+
+
+    def get_timed_price(self, symbol: str) -> Optional[Tuple[float, float]]:
+        """
+        Returns the shared price snapshot for a symbol with the time the price was produced.
+        
+        :param symbol: Trading pair symbol (e.g., BTC-BRL)
+        :return: Tuple of (monotonic price time, price) or None if unavailable
+        """
+        
+        return self.price_cache.get_timed(symbol)  # Read (or fetch once) the shared snapshot
+
+
+    def fetch_last_price(self, symbol: str) -> Optional[Tuple[float, float]]:
+        """
+        Returns the latest pushed price for a symbol with its receive time, falling back to REST when stale.
+        
+        :param symbol: Trading pair symbol (e.g., BTC-BRL)
+        :return: Tuple of (monotonic price time, price) or None if unavailable
+        """
+        
+        if self.market_stream is not None:  # Verify if a market data stream is available
+            entry = self.market_stream.get_last_price_entry(symbol, self.stream_max_age)  # Read latest streamed price (already a float) and its receive time from memory
+            if entry is not None:  # Verify if streamed price is fresh
+                return entry  # Return streamed price with its receive time
+            
+            now = time.monotonic()  # Current time
+            if self.market_stream.is_stale(self.stream_max_age) and now - self.stream_reset_at > self.stream_max_age:  # Verify if the open connection went silent and was not reset recently
+                self.stream_reset_at = now  # Remember reset time
+                self.market_stream.reconnect()  # Silent connection, reopen it
+        return self.fetch_rest_price(symbol)  # Fall back to the REST ticker
+
+
     def update_average_price(self) -> bool:
         """
         Updates the cached average purchase price.
@@ -123,26 +529,39 @@ class TradingBot:
         """
         
         avg_price = self.account_manager.calculate_average_price(  # Calculate average price
-            self.config.CRYPTO,  # Crypto symbol
-            self.config.PRIMARY_SYMBOL  # Trading pair
+            self.crypto,  # Crypto symbol
+            self.symbol  # Trading pair
         )
         
         if avg_price is not None:  # Verify if average price calculated
             self.current_average_price = avg_price  # Update cached average price
+            self.average_price_key = (self.average_price_version, time.monotonic())  # Remember which version was calculated and when
             return True  # Return success
         return False  # Return failure
 
 
+    def invalidate_average_price(self) -> None:
+        """
+        Marks the cached average price as outdated (e.g., after a buy fill).
+        
+        :param: None
+        :return: None
+        """
+        
+        self.average_price_version += 1  # Next read misses the cache and recalculates
+
+
     def get_average_price(self) -> Optional[float]:
         """
-        Returns the current average purchase price, updating if necessary.
+        Returns the current average purchase price, recalculating when outdated or expired.
         
         :param: None
         :return: Average price as float or None if unavailable
         """
         
-        if self.current_average_price is None:  # Verify if average price not cached
-            self.update_average_price()  # Update average price
+        key = self.average_price_key  # Get (version, calculation time) of the cached value
+        if key is None or key[0] != self.average_price_version or time.monotonic() - key[1] >= self.average_price_max_age:  # Verify if cache is missing, outdated or expired
+            self.update_average_price()  # Recalculate (keeps the last known value on failure)
         return self.current_average_price  # Return cached average price
 
 
@@ -158,93 +577,111 @@ class TradingBot:
         if average_price == 0:  # Verify for division by zero
             return 0.0  # Return zero if average price is zero
         
-        difference = current_price - average_price  # Calculate price difference
-        percentage = difference / average_price  # Calculate percentage
-        return percentage  # Return percentage difference
+        return (current_price - average_price) / average_price  # Return percentage difference
 
 
-    def verify_buy_rules(self, current_price: float, average_price: float) -> Optional[Dict]:
+    def update_trigger_prices(self, average_price: float) -> None:
         """
-        Evaluates buy rules and returns action if triggered.
+        Precomputes the absolute trigger prices for an average price.
         
-        :param current_price: Current market price
         :param average_price: Average purchase price
-        :return: Dictionary with action details or None if no rule triggered
+        :return: None
         """
         
-        percentage_diff = self.calculate_percentage_difference(current_price, average_price)  # Calculate percentage difference
-        
-        rules = self.config.RULES  # Get trading rules
-        
-        if percentage_diff >= rules.BTC_BUY_THRESHOLD_3:  # Verify threshold 3 (25%)
-            rule_key = f"buy_3_{int(average_price)}"  # Generate unique rule key
-            if rule_key not in self.executed_rules:  # Verify if rule not already executed
-                return {  # Return buy action
-                    "action": "buy",  # Action type
-                    "reason": f"Price {percentage_diff*100:.2f}% above average (threshold: 25%)",  # Reason
-                    "amount_percentage": rules.BTC_BUY_AMOUNT_3,  # Amount to buy (50%)
-                    "rule_key": rule_key  # Rule identifier
-                }
-        
-        elif percentage_diff >= rules.BTC_BUY_THRESHOLD_2:  # Verify threshold 2 (20%)
-            rule_key = f"buy_2_{int(average_price)}"  # Generate unique rule key
-            if rule_key not in self.executed_rules:  # Verify if rule not already executed
-                return {  # Return buy action
-                    "action": "buy",  # Action type
-                    "reason": f"Price {percentage_diff*100:.2f}% above average (threshold: 20%)",  # Reason
-                    "amount_percentage": rules.BTC_BUY_AMOUNT_2,  # Amount to buy (20%)
-                    "rule_key": rule_key  # Rule identifier
-                }
-        
-        elif percentage_diff >= rules.BTC_BUY_THRESHOLD_1:  # Verify threshold 1 (10%)
-            rule_key = f"buy_1_{int(average_price)}"  # Generate unique rule key
-            if rule_key not in self.executed_rules:  # Verify if rule not already executed
-                return {  # Return buy action
-                    "action": "buy",  # Action type
-                    "reason": f"Price {percentage_diff*100:.2f}% above average (threshold: 10%)",  # Reason
-                    "amount_percentage": rules.BTC_BUY_AMOUNT_1,  # Amount to buy (10%)
-                    "rule_key": rule_key  # Rule identifier
-                }
-        
-        return None  # Return None if no buy rule triggered
+        self.buy_trigger_prices = tuple(average_price * (1.0 + threshold) for threshold in self.buy_thresholds)  # Buy trigger prices, lowest first
+        self.sell_trigger_price = average_price * (1.0 + self.sell_threshold)  # Sell trigger price
+        self.lowest_trigger_price = min(self.buy_trigger_prices + (self.sell_trigger_price,))  # Lowest price at which a rule can fire
+        self.average_bucket = math.floor(math.log(average_price) / self.bucket_log_step)  # Log-scale bucket, stable across small average price drift
+        self.trigger_average = average_price  # Remember which average the trigger prices belong to
 
 
-    def verify_sell_rules(self, current_price: float, average_price: float) -> Optional[Dict]:
+    def verify_rules(self, current_price: float, average_price: float) -> Optional[Dict]:
         """
-        Evaluates sell rules and returns action if triggered.
+        Evaluates buy and sell rules against precomputed trigger prices and returns the triggered action.
+        
+        The highest reached buy threshold is considered first, then the sell threshold.
+        Ticks only compare prices; the percentage and the action dictionary are only built when a rule fires.
         
         :param current_price: Current market price
         :param average_price: Average purchase price
         :return: Dictionary with action details or None if no rule triggered
         """
         
-        percentage_diff = self.calculate_percentage_difference(current_price, average_price)  # Calculate percentage difference
+        if average_price != self.trigger_average:  # Verify if the average price changed since the trigger prices were computed
+            if not average_price:  # Verify if average price is usable
+                return None  # No rule can fire without an average price
+            self.update_trigger_prices(average_price)  # Recompute trigger prices (only after the average changes)
+        
+        if current_price < self.lowest_trigger_price:  # Verify if no threshold reached (the common case)
+            return None  # Return None with comparisons only
+        
+        bucket = self.average_bucket  # Average price bucket of the rules
+        tier = decide_tier(current_price, self.buy_trigger_prices, self.sell_trigger_price, self.executed_mask.get(bucket, 0), self.sell_rule_bit)  # Decide on primitives only
+        if tier == 0:  # Verify if no rule fires
+            return None  # Return None without building an action
+        
+        if tier > 0:  # Verify if a buy rule fires
+            threshold, amount = self.buy_rules_ascending[tier - 1]  # Get highest reached rule
+            rule = (bucket, 1 << (tier - 1))  # Rule identifier (tier 1 is the lowest threshold)
+            return {  # Return buy action
+                "action": "buy",  # Action type
+                "reason": f"Price {self.calculate_percentage_difference(current_price, average_price)*100:.2f}% above average (threshold: {threshold*100:.0f}%)",  # Reason
+                "amount_percentage": amount,  # Amount to buy
+                "rule": rule,  # Rule identifier
+                "rule_key": self.rule_key(rule)  # Readable rule identifier for logs
+            }
+        
+        rule = (bucket, self.sell_rule_bit)  # Sell rule fires (tier -1), build its identifier
+        return {  # Return sell action
+            "action": "sell",  # Action type
+            "reason": f"Price {self.calculate_percentage_difference(current_price, average_price)*100:.2f}% above average (threshold: {self.sell_threshold*100:.0f}%)",  # Reason
+            "amount_percentage": self.sell_amount,  # Amount to sell (20%)
+            "rule": rule,  # Rule identifier
+            "rule_key": self.rule_key(rule)  # Readable rule identifier for logs
+        }
+
+
+    def rule_key(self, rule: Tuple[int, int]) -> str:
+        """
+        Formats a rule identifier as a readable key (e.g., buy_1_2374 or sell_2374) for logs.
+        
+        :param rule: Rule identifier as (average price bucket, rule bit)
+        :return: Readable rule key
+        """
         
-        rules = self.config.RULES  # Get trading rules
+        bucket, bit = rule  # Unpack rule identifier
+        if bit == self.sell_rule_bit:  # Verify if rule is the sell rule
+            return f"{SELL_RULE_PREFIX}{bucket}"  # Return sell rule key
+        return f"{BUY_RULE_PREFIX}{bit.bit_length()}_{bucket}"  # Return buy rule key (bit position + 1 is the tier)
+
+
+    def mark_rule_executed(self, rule: Tuple[int, int]) -> None:
+        """
+        Records a rule as executed so it does not fire again for the same average price bucket (also after a restart).
         
-        if percentage_diff >= rules.BTC_SELL_THRESHOLD:  # Verify sell threshold (100%)
-            rule_key = f"sell_{int(average_price)}"  # Generate unique rule key
-            if rule_key not in self.executed_rules:  # Verify if rule not already executed
-                return {  # Return sell action
-                    "action": "sell",  # Action type
-                    "reason": f"Price {percentage_diff*100:.2f}% above average (threshold: 100%)",  # Reason
-                    "amount_percentage": rules.BTC_SELL_AMOUNT,  # Amount to sell (20%)
-                    "rule_key": rule_key  # Rule identifier
-                }
+        :param rule: Rule identifier as (average price bucket, rule bit)
+        :return: None
+        """
         
-        return None  # Return None if no sell rule triggered
+        bucket, bit = rule  # Unpack rule identifier
+        with self.order_lock:  # Update the bits atomically with respect to rule claims
+            self.executed_mask[bucket] = self.executed_mask.get(bucket, 0) | bit  # Set rule bit for the bucket
+            if self.rules_store is not None and not self.rules_store.set_bits(bucket, bit):  # Verify if the rule bit could not be persisted
+                self.log(f"Executed rule {self.rule_key(rule)} is outside the executed rules file, kept in memory only")  # Log unpersisted rule
 
 
-    def execute_buy(self, amount_percentage: float, rule_key: str) -> bool:
+    def execute_buy(self, amount_percentage: float, rule: Tuple[int, int], available_brl: Optional[float] = None) -> bool:
         """
         Executes a buy order for a percentage of available BRL balance.
         
         :param amount_percentage: Percentage of balance to spend (0.10 = 10%)
-        :param rule_key: Rule identifier for duplicate prevention
+        :param rule: Rule identifier as (average price bucket, rule bit) for duplicate prevention
+        :param available_brl: Already fetched available BRL balance (fetched if omitted)
         :return: True if order placed successfully, False otherwise
         """
         
-        available_brl = self.account_manager.get_available_balance(self.config.FIAT)  # Get available BRL balance
+        if available_brl is None:  # Verify if balance was not prefetched
+            available_brl = self.account_manager.get_available_balance(self.fiat)  # Get available BRL balance
         
         if available_brl <= 0:  # Verify if balance available
             self.log(f"Insufficient BRL balance: {available_brl}")  # Log insufficient balance
@@ -256,42 +693,21 @@ class TradingBot:
             self.log(f"Order cost too low: {cost} BRL (minimum: 10 BRL)")  # Log low cost
             return False  # Return failure
         
-        account_id = self.account_manager.get_account_id()  # Get account ID
-        if not account_id:  # Verify if account ID available
-            self.log("Account ID not available")  # Log missing account ID
-            return False  # Return failure
-        
-        self.log(f"Executing BUY: {cost:.2f} BRL ({amount_percentage*100:.0f}% of balance)")  # Log buy action
-        
-        result = self.api_client.place_order(  # Place market buy order
-            account_id=account_id,  # Account ID
-            symbol=self.config.PRIMARY_SYMBOL,  # Trading pair
-            side="buy",  # Buy side
-            order_type="market",  # Market order type
-            cost=cost  # Cost in BRL
-        )
-        
-        if result:  # Verify if order placed successfully
-            order_id = result.get("orderId")  # Get order ID
-            self.log(f"Buy order placed successfully. Order ID: {order_id}")  # Log success
-            self.executed_rules.add(rule_key)  # Mark rule as executed
-            self.update_average_price()  # Update average price after buy
-            return True  # Return success
-        else:  # Order placement failed
-            self.log("Buy order failed")  # Log failure
-            return False  # Return failure
+        return self.place_market_order("buy", rule, f"{cost:.2f} BRL ({amount_percentage*100:.0f}% of balance)", cost=cost)  # Place market buy order for the cost in BRL
 
 
-    def execute_sell(self, amount_percentage: float, rule_key: str) -> bool:
+    def execute_sell(self, amount_percentage: float, rule: Tuple[int, int], available_btc: Optional[float] = None) -> bool:
         """
         Executes a sell order for a percentage of available BTC balance.
         
         :param amount_percentage: Percentage of balance to sell (0.20 = 20%)
-        :param rule_key: Rule identifier for duplicate prevention
+        :param rule: Rule identifier as (average price bucket, rule bit) for duplicate prevention
+        :param available_btc: Already fetched available BTC balance (fetched if omitted)
         :return: True if order placed successfully, False otherwise
         """
         
-        available_btc = self.account_manager.get_available_balance(self.config.CRYPTO)  # Get available BTC balance
+        if available_btc is None:  # Verify if balance was not prefetched
+            available_btc = self.account_manager.get_available_balance(self.crypto)  # Get available BTC balance
         
         if available_btc <= 0:  # Verify if balance available
             self.log(f"Insufficient BTC balance: {available_btc}")  # Log insufficient balance
@@ -303,74 +719,151 @@ class TradingBot:
             self.log(f"Order quantity too low: {qty} BTC")  # Log low quantity
             return False  # Return failure
         
+        return self.place_market_order("sell", rule, f"{qty:.8f} BTC ({amount_percentage*100:.0f}% of balance)", qty=str(qty))  # Place market sell order for the quantity as string
+
+
+    def place_market_order(self, side: str, rule: Tuple[int, int], description: str, qty: Optional[str] = None, cost: Optional[float] = None) -> bool:
+        """
+        Places a market order and records its effects (shared by buys and sells).
+        
+        The rule is claimed as in-flight first, so a concurrent cycle that triggers the same rule
+        before this order's response arrives does not submit a duplicate order.
+        
+        :param side: Order side (buy or sell)
+        :param rule: Rule identifier as (average price bucket, rule bit) for duplicate prevention
+        :param description: Human-readable order size for the logs
+        :param qty: Order quantity (sells)
+        :param cost: Order cost in quote currency (buys)
+        :return: True if order placed successfully, False otherwise
+        """
+        
         account_id = self.account_manager.get_account_id()  # Get account ID
         if not account_id:  # Verify if account ID available
             self.log("Account ID not available")  # Log missing account ID
             return False  # Return failure
         
-        self.log(f"Executing SELL: {qty:.8f} BTC ({amount_percentage*100:.0f}% of balance)")  # Log sell action
+        bucket, bit = rule  # Unpack rule identifier
+        with self.order_lock:  # Claim the rule atomically
+            if (self.executed_mask.get(bucket, 0) | self.inflight_mask.get(bucket, 0)) & bit:  # Verify if rule already executed or being submitted
+                return False  # Do not submit a duplicate order
+            self.inflight_mask[bucket] = self.inflight_mask.get(bucket, 0) | bit  # Mark rule as in-flight
+        
+        try:  # Submit the order, always releasing the claim
+            self.log(f"Executing {side.upper()}: {description}")  # Log order action
+            
+            result = self.api_client.place_order(  # Place market order
+                account_id=account_id,  # Account ID
+                symbol=self.symbol,  # Trading pair
+                side=side,  # Order side
+                order_type="market",  # Market order type
+                qty=qty,  # Quantity (sells)
+                cost=cost  # Cost in BRL (buys)
+            )
+            
+            if not result:  # Verify if order placement failed
+                self.log(f"{side.capitalize()} order failed")  # Log failure
+                return False  # Return failure
+            
+            self.log(f"{side.capitalize()} order placed successfully. Order ID: {result.get('orderId')}")  # Log success
+            self.mark_rule_executed(rule)  # Mark rule as executed (before the in-flight claim is released)
+            self.account_manager.invalidate_balances()  # Balances changed, drop cached values
+            if side == "buy":  # Verify if the fill changes the average purchase price
+                self.invalidate_average_price()  # Recalculate average price on next read
+            return True  # Return success
+        finally:  # Release the in-flight claim
+            with self.order_lock:  # Update the bits atomically
+                self.inflight_mask[bucket] &= ~bit  # Clear in-flight rule bit
+
+
+    def get_tick_snapshot(self, prefetch_balances: bool = True) -> TickSnapshot:
+        """
+        Fetches the price, average price and (optionally) balances of a cycle concurrently.
         
-        result = self.api_client.place_order(  # Place market sell order
-            account_id=account_id,  # Account ID
-            symbol=self.config.PRIMARY_SYMBOL,  # Trading pair
-            side="sell",  # Sell side
-            order_type="market",  # Market order type
-            qty=str(qty)  # Quantity as string
-        )
+        :param prefetch_balances: Whether to fetch balances with the prices (otherwise they are fetched only when a rule fires)
+        :return: TickSnapshot with the fetched values
+        """
         
-        if result:  # Verify if order placed successfully
-            order_id = result.get("orderId")  # Get order ID
-            self.log(f"Sell order placed successfully. Order ID: {order_id}")  # Log success
-            self.executed_rules.add(rule_key)  # Mark rule as executed
-            return True  # Return success
-        else:  # Order placement failed
-            self.log("Sell order failed")  # Log failure
-            return False  # Return failure
+        if not prefetch_balances:  # Verify if only the prices are needed
+            price, price_at = self.get_timed_price(self.symbol) or (None, 0.0)  # Read price and its time (usually from memory)
+            return TickSnapshot(price, self.get_average_price(), None, None, price_at)  # Return prices only
+        
+        timed, average_price, balances = self.api_client.run_concurrently([  # Independent fetches, so the cycle waits for the slowest one only
+            (self.get_timed_price, (self.symbol,)),  # Current price and its time (streamed when fresh)
+            (self.get_average_price, ()),  # Average purchase price (cached while valid)
+            (self.account_manager.get_balances, ()),  # Balances (refreshes the parsed available amounts)
+        ])
+        price, price_at = timed or (None, 0.0)  # Unpack price and its time
+        
+        if not balances:  # Verify if balances could not be fetched
+            return TickSnapshot(price, average_price, None, None, price_at)  # Let order execution fetch balances itself
+        
+        available = self.account_manager.available_by_symbol  # Parsed available amounts of the fetched balances
+        return TickSnapshot(price, average_price, available.get(self.fiat, 0.0), available.get(self.crypto, 0.0), price_at)  # Return snapshot
 
 
-    def evaluate_and_execute(self) -> None:
+    def evaluate_and_execute(self, prefetch_balances: bool = True) -> None:
         """
         Evaluates trading rules and executes orders if conditions are met.
         
-        :param: None
+        :param prefetch_balances: Whether to fetch balances together with the prices
         :return: None
         """
         
-        current_price = self.get_current_price(self.config.PRIMARY_SYMBOL)  # Get current price
+        snapshot = self.get_tick_snapshot(prefetch_balances)  # Fetch cycle inputs concurrently
+        
+        current_price = snapshot.price  # Get current price
         if not current_price:  # Verify if price retrieved
             self.log("Failed to retrieve current price")  # Log failure
             return  # Exit if price not available
         
-        average_price = self.get_average_price()  # Get average purchase price
+        average_price = snapshot.average_price  # Get average purchase price
         if not average_price:  # Verify if average price available
             self.log("No average price available (no previous purchases)")  # Log no average
             return  # Exit if no average price
         
-        self.log(f"Current: {current_price:.2f} BRL | Average: {average_price:.2f} BRL")  # Log prices
-        
-        buy_action = self.verify_buy_rules(current_price, average_price)  # Verify buy rules
-        if buy_action:  # Verify if buy action triggered
-            self.log(f"BUY RULE TRIGGERED: {buy_action['reason']}")  # Log buy trigger
-            self.execute_buy(buy_action["amount_percentage"], buy_action["rule_key"])  # Execute buy
-            return  # Exit after executing buy
-        
-        sell_action = self.verify_sell_rules(current_price, average_price)  # Verify sell rules
-        if sell_action:  # Verify if sell action triggered
-            self.log(f"SELL RULE TRIGGERED: {sell_action['reason']}")  # Log sell trigger
-            self.execute_sell(sell_action["amount_percentage"], sell_action["rule_key"])  # Execute sell
-            return  # Exit after executing sell
-
-
-    def run_cycle(self) -> None:
+        if self.log_every_tick:  # Verify if verbose per-cycle logs are enabled
+            self.log(f"Current: {current_price:.2f} BRL | Average: {average_price:.2f} BRL")  # Log prices
+        
+        action = self.verify_rules(current_price, average_price)  # Verify buy and sell rules in one lookup
+        if action is None:  # Verify if no rule triggered (the common case)
+            return  # Nothing to execute
+        
+        is_buy = action["action"] == "buy"  # Whether the triggered action is a buy
+        available = snapshot.available_fiat if is_buy else snapshot.available_crypto  # Prefetched balance for the order side
+        if available is None:  # Verify if balances were not prefetched
+            available = self.account_manager.get_available_balance(self.fiat if is_buy else self.crypto)  # Fetch balance before the staleness check
+        
+        if time.monotonic() - snapshot.price_at > self.max_price_age:  # Verify if the price is too old to act on (streamed long ago, or aged while fetching balances)
+            timed = self.fetch_rest_price(self.symbol)  # Confirm the trigger with a new REST price
+            if timed is None or time.monotonic() - timed[0] > self.max_price_age:  # Verify if a fresh price was obtained in time
+                self.log(f"Skipping {action['action'].upper()}: no price younger than {self.max_price_age}s available")  # Log stale price
+                return  # Re-evaluate on the next cycle
+            confirmed = self.verify_rules(timed[1], average_price)  # Re-evaluate rules with the fresh price
+            if confirmed is None or confirmed["action"] != action["action"]:  # Verify if the fresh price still triggers the same side
+                return  # Re-evaluate on the next cycle
+            action = confirmed  # Act on the confirmed rule
+        
+        if is_buy:  # Verify if buy action triggered
+            self.log(f"BUY RULE TRIGGERED: {action['reason']}")  # Log buy trigger
+            self.execute_buy(action["amount_percentage"], action["rule"], available)  # Execute buy with the fetched balance
+        else:  # Sell action triggered
+            self.log(f"SELL RULE TRIGGERED: {action['reason']}")  # Log sell trigger
+            self.execute_sell(action["amount_percentage"], action["rule"], available)  # Execute sell with the fetched balance
+
+
+    def run_cycle(self, prefetch_balances: bool = True) -> None:
         """
         Runs a single monitoring and trading cycle.
         
-        :param: None
+        :param prefetch_balances: Whether to fetch balances together with the prices
         :return: None
         """
         
+        if not self.rules_loaded:  # Verify if executed rules were not restored yet
+            self.load_executed_rules()  # Open the executed rules file on first use
+        
         try:  # Attempt to run cycle
-            self.evaluate_and_execute()  # Evaluate rules and execute trades
+            self.evaluate_and_execute(prefetch_balances)  # Evaluate rules and execute trades
         except Exception as e:  # Catch any exceptions
             self.log(f"Error in trading cycle: {str(e)}")  # Log error
 
@@ -384,34 +877,133 @@ class TradingBot:
         """
         
         self.is_running = True  # Set running state to True
+        self.stop_event.clear()  # Reset stop signal
         self.log("Trading bot started")  # Log bot start
         
-        while self.is_running:  # Main loop
-            self.run_cycle()  # Run one cycle
-            time.sleep(self.config.VERIFICATION_INTERVAL)  # Wait for next cycle
+        pushed = False  # Whether the current cycle was triggered by a streamed price update
+        while not self.stop_event.is_set():  # Main loop until stop is signaled
+            self.run_cycle(prefetch_balances=not pushed)  # Run one cycle (pushed cycles fetch balances only when a rule fires)
+            pushed = self.wait_for_next_cycle()  # Wait for a price update or the verification interval
+        
+        self.is_running = False  # Set running state to False
+
+
+    def wait_for_next_cycle(self) -> bool:
+        """
+        Waits for the next streamed price update, or the verification interval without a stream.
+        
+        :param: None
+        :return: True if woken by a streamed price update, False on timeout or stop
+        """
+        
+        if self.market_stream is None:  # Verify if prices are only available by polling
+            self.stop_event.wait(self.verification_interval)  # Wait for next cycle (returns early on stop)
+            return False  # Polling cycle
+        
+        updated = self.market_stream.wait_for_ticker(self.symbol, self.verification_interval)  # Wait for a pushed price (the interval is the fallback polling period)
+        return updated and not self.stop_event.is_set()  # Pushed cycle unless stopping
+
+
+    def request_stop(self) -> None:
+        """
+        Signals the main loop and the market data stream to stop, without logging (safe in signal handlers).
+        
+        Signal handlers run between bytecodes of the main thread, which may be holding a log queue lock;
+        this method therefore only sets events and closes the stream.
+        
+        :param: None
+        :return: None
+        """
+        
+        self.stop_event.set()  # Wake and end the main loop
+        if self.market_stream is not None:  # Verify if a market data stream is attached
+            self.market_stream.stop()  # Stop the WebSocket connection
 
 
     def stop(self) -> None:
         """
-        Stops the trading bot.
+        Stops the trading bot and its market data stream, closes the executed rules file and logs it (safe to call more than once, not from signal handlers).
         
         :param: None
         :return: None
         """
         
+        if self.stopped:  # Verify if already stopped
+            return  # Do nothing on repeated calls
+        
+        self.stopped = True  # Remember shutdown
         self.is_running = False  # Set running state to False
+        self.request_stop()  # Stop the main loop and the stream
+        with self.order_lock:  # Do not close the file while a rule bit is being written
+            if self.rules_store is not None:  # Verify if executed rules are persisted
+                self.rules_store.close()  # Flush and unmap the executed rules file
+                self.rules_store = None  # Closed store must not be written again
         self.log("Trading bot stopped")  # Log bot stop
 
 
-def create_trading_bot(api_client, account_manager, config, logger=None) -> TradingBot:
+def create_trade_logger(name: str = TRADE_LOGGER_NAME) -> logging.Logger:
+    """
+    Returns the trading logger, configuring it once to print records to stdout.
+    
+    No queue or thread is added here: main.py redirects stdout to the Logger, whose writer
+    thread already takes the I/O off the caller, so a log call is a single enqueue there.
+    
+    :param name: Logger name
+    :return: Configured logger
+    """
+    
+    logger = logging.getLogger(name)  # Get named logger
+    if logger.handlers:  # Verify if already configured
+        return logger  # Return configured logger
+    
+    handler = StdoutHandler()  # Print records to the (redirected) stdout
+    handler.setFormatter(logging.Formatter("%(message)s"))  # Keep the plain message output
+    
+    logger.addHandler(handler)  # Attach handler
+    logger.setLevel(logging.INFO)  # Emit informational messages
+    logger.propagate = False  # Do not also pass records to the root logger
+    return logger  # Return configured logger
+
+
+def decide_tier(price: float, buy_trigger_prices: Tuple[float, ...], sell_trigger_price: float, executed_bits: int, sell_bit: int) -> int:
+    """
+    Decides which rule fires for a price, using only numbers (no dictionaries or strings).
+    
+    The highest reached buy tier wins unless it was already executed, then the sell rule is verified.
+    
+    :param price: Current market price
+    :param buy_trigger_prices: Absolute buy trigger prices, lowest first
+    :param sell_trigger_price: Absolute sell trigger price
+    :param executed_bits: Executed rule bits of the current average price bucket (buy tier N is bit N - 1)
+    :param sell_bit: Bit of the sell rule
+    :return: Buy tier (1 = lowest threshold) for a buy, -1 for a sell, 0 if no rule fires
+    """
+    
+    tier = bisect_right(buy_trigger_prices, price)  # Number of reached buy trigger prices (the highest reached one is the tier)
+    if tier and not executed_bits & (1 << (tier - 1)):  # Verify if a buy threshold was reached and its rule not already executed
+        return tier  # Buy tier fires
+    if price >= sell_trigger_price and not executed_bits & sell_bit:  # Verify sell threshold and if rule not already executed
+        return -1  # Sell rule fires
+    return 0  # No rule fires
+
+
+def create_trading_bot(api_client, account_manager, config, logger=None, market_stream=None, average_price: Optional[float] = None, price_cache: Optional[PriceCache] = None, rules_store: Optional[ExecutedRulesStore] = None) -> TradingBot:
     """
     Factory function to create a TradingBot instance.
     
     :param api_client: APIClient instance for API operations
     :param account_manager: AccountManager instance for account operations
     :param config: Configuration object containing trading rules
-    :param logger: Optional logger for output
+    :param logger: Optional logging.Logger (anything with an info method) receiving the logs (defaults to the "trader" logger)
+    :param market_stream: Optional MarketDataStream providing pushed prices
+    :param average_price: Optional already calculated average purchase price
+    :param price_cache: Optional shared PriceCache (one is created if omitted)
+    :param rules_store: Optional ExecutedRulesStore (opened from config.EXECUTED_RULES_PATH when the bot starts if omitted)
     :return: Initialized TradingBot instance
     """
     
-    return TradingBot(api_client, account_manager, config, logger)  # Create and return TradingBot instance
+    return TradingBot(api_client, account_manager, config, logger, market_stream, average_price, price_cache, rules_store)  # Create and return TradingBot instance
+
+
+# Module Initialization:
+TRADE_LOGGER = create_trade_logger()  # Trading logger, configured once at import
@@ -0,0 +1,385 @@
+"""
+================================================================================
+Mercado Bitcoin Trading Bot - WebSocket Market Data Module
+================================================================================
+Author      : Breno Farias da Silva
+Created     : 2026-02-16
+Description :
+    WebSocket market data module for the Mercado Bitcoin trading bot.
+    This module keeps a persistent WebSocket connection to the exchange,
+    subscribes to ticker and order book channels and stores the latest
+    message per channel and symbol in memory, so price reads do not need
+    a REST round-trip.
+
+    Key features include:
+        - Persistent WebSocket connection in a background daemon thread
+        - Ticker and order book channel subscriptions per symbol
+        - In-memory latest message cache with receive timestamps
+        - Ticker last price parsed to float once, when the message arrives
+        - Staleness-aware reads (stale data is reported as unavailable)
+        - Automatic reconnection after disconnects
+        - Explicit JSON ping/pong keepalive with stalled connection detection
+        - Ticker update signal so consumers can react to pushes instead of polling
+
+Usage:
+    1. Initialize MarketDataStream with the symbols to follow.
+        stream = MarketDataStream(["BTC-BRL"])
+    2. Start the background connection.
+        stream.start()
+    3. Read the latest data, falling back to REST when None is returned.
+        ticker = stream.get_ticker("BTC-BRL", max_age=10)
+        price = stream.get_last_price("BTC-BRL", max_age=10)
+    4. Optionally block until the next ticker update (or a timeout).
+        updated = stream.wait_for_ticker("BTC-BRL", timeout=60)
+    5. Stop the stream on shutdown.
+        stream.stop()
+
+Outputs:
+    - Latest ticker and order book data kept in memory
+
+TODOs:
+    - Add trades channel support
+    - Expose connection state metrics
+
+Dependencies:
+    - Python >= 3.8
+    - websocket-client
+    - orjson (optional, falls back to the json standard library module)
+    - json (standard library)
+    - threading (standard library)
+    - time (standard library)
+    - typing (standard library)
+
+Assumptions & Notes:
+    - Symbols use the REST format (e.g., BTC-BRL) and are converted to the
+      WebSocket instrument format (e.g., BRLBTC) internally
+    - Cached data older than the requested max age is treated as missing
+    - reconnect() can be used by consumers that detect stale prices
+    - A connection that receives nothing (not even a pong) for
+      RECEIVE_TIMEOUT seconds is closed and reconnected
+"""
+
+import json  # For encoding subscriptions
+import threading  # For the background connection thread
+import time  # For receive timestamps
+import websocket  # For the WebSocket connection (websocket-client)
+from typing import Dict, Iterable, Optional, Tuple  # For type hints
+
+try:  # Prefer orjson for faster message decoding
+    import orjson  # For fast JSON decoding
+    json_loads = orjson.loads  # Parse JSON messages
+except ImportError:  # Fall back to the standard library when orjson is not installed
+    json_loads = json.loads  # Parse JSON messages
+
+
+# WebSocket Constants:
+WS_URL = "wss://ws.mercadobitcoin.net/ws"  # Mercado Bitcoin WebSocket endpoint
+RECONNECT_DELAY = 5  # Seconds to wait before reconnecting after a disconnect
+PING_INTERVAL = 20  # Seconds between application-level pings
+PING_MESSAGE = json.dumps({"type": "ping"})  # Pre-encoded ping message (answered with a pong message)
+RECEIVE_TIMEOUT = 3 * PING_INTERVAL  # Seconds without any message before the connection is considered stalled
+
+
+# Classes Definitions:
+
+
+class MarketDataStream:  # WebSocket market data stream
+    """
+    Streams ticker and order book data from Mercado Bitcoin over WebSocket.
+    
+    :param: None
+    :return: None
+    """
+
+
+    def __init__(self, symbols: Iterable[str], channels: Iterable[str] = ("ticker", "orderbook"), url: str = WS_URL, reconnect_delay: float = RECONNECT_DELAY):
+        """
+        Initializes the MarketDataStream.
+        
+        :param symbols: Trading pair symbols to subscribe to (e.g., BTC-BRL)
+        :param channels: Channel names to subscribe to for each symbol
+        :param url: WebSocket endpoint URL
+        :param reconnect_delay: Seconds to wait before reconnecting
+        :return: None
+        """
+        
+        self.symbols = list(symbols)  # Store symbols
+        self.channels = tuple(channels)  # Store channel names
+        self.url = url  # Store endpoint URL
+        self.reconnect_delay = reconnect_delay  # Store reconnect delay
+        self.symbol_by_stream_id: Dict[str, str] = {to_stream_id(symbol): symbol for symbol in self.symbols}  # Map instrument IDs back to symbols
+        self.latest: Dict[Tuple[str, str], Tuple[float, Dict]] = {}  # Latest (receive time, data) per (channel, symbol)
+        self.last_prices: Dict[str, Tuple[float, float]] = {}  # Latest (receive time, parsed last price) per symbol
+        self.stop_event = threading.Event()  # Signal to stop the connection loop
+        self.thread: Optional[threading.Thread] = None  # Background connection thread
+        self.ws: Optional[websocket.WebSocketApp] = None  # Current WebSocket application
+        self.keepalive_thread: Optional[threading.Thread] = None  # Background ping thread
+        self.last_received = time.monotonic()  # Receive time of the latest message (any type)
+        self.connected = False  # Whether the current connection is open
+        self.ticker_events: Dict[str, threading.Event] = {symbol: threading.Event() for symbol in self.symbols}  # Per symbol, set whenever its ticker update is stored (or the stream stops)
+
+
+    def start(self) -> None:
+        """
+        Starts the background connection thread.
+        
+        :param: None
+        :return: None
+        """
+        
+        if self.thread is not None and self.thread.is_alive():  # Verify if already running
+            return  # Do nothing if already started
+        
+        self.stop_event.clear()  # Reset stop signal
+        self.thread = threading.Thread(target=self.run, name="MarketDataStream", daemon=True)  # Create daemon thread
+        self.thread.start()  # Start connection thread
+        self.keepalive_thread = threading.Thread(target=self.keepalive, name="MarketDataStreamKeepalive", daemon=True)  # Create daemon ping thread
+        self.keepalive_thread.start()  # Start ping thread
+
+
+    def stop(self) -> None:
+        """
+        Stops the connection loop and closes the WebSocket.
+        
+        :param: None
+        :return: None
+        """
+        
+        self.stop_event.set()  # Signal connection loop to stop
+        for event in self.ticker_events.values():  # Iterate through symbol events
+            event.set()  # Wake any consumer waiting for a ticker update
+        if self.ws is not None:  # Verify if a connection exists
+            self.ws.close()  # Close current connection
+
+
+    def run(self) -> None:
+        """
+        Connection loop: connects, streams messages and reconnects until stopped.
+        
+        :param: None
+        :return: None
+        """
+        
+        while not self.stop_event.is_set():  # Loop until stop is requested
+            self.ws = websocket.WebSocketApp(  # Create WebSocket application
+                self.url,  # Endpoint URL
+                on_open=self.on_open,  # Subscribe on connect
+                on_message=self.on_message,  # Store incoming data
+            )
+            try:  # Attempt to run the connection
+                self.ws.run_forever()  # Block until the connection closes (pings are sent by the keepalive thread)
+            except Exception:  # Handle unexpected connection errors
+                pass  # Reconnect below
+            self.connected = False  # Connection closed
+            self.stop_event.wait(self.reconnect_delay)  # Wait before reconnecting (returns early on stop)
+
+
+    def keepalive(self) -> None:
+        """
+        Ping loop: sends a JSON ping every PING_INTERVAL seconds and closes stalled connections.
+        
+        :param: None
+        :return: None
+        """
+        
+        while not self.stop_event.wait(PING_INTERVAL):  # Loop until stop is requested (returns early on stop)
+            ws = self.ws  # Get current WebSocket application
+            if ws is None or ws.sock is None or not ws.sock.connected:  # Verify if a connection is open
+                continue  # Nothing to ping while reconnecting
+            
+            if time.monotonic() - self.last_received > RECEIVE_TIMEOUT:  # Verify if the connection stalled
+                ws.close()  # Close stalled connection (the connection loop reconnects)
+                continue  # Skip ping on a closed connection
+            
+            try:  # Attempt to send ping
+                ws.send(PING_MESSAGE)  # Send pre-encoded ping message
+            except Exception:  # Handle connection closed while sending
+                pass  # The connection loop reconnects
+
+
+    def on_open(self, ws) -> None:
+        """
+        Subscribes to all configured channels once connected.
+        
+        :param ws: WebSocket application instance
+        :return: None
+        """
+        
+        self.last_received = time.monotonic()  # Start the stall timer for the new connection
+        self.connected = True  # Connection established
+        for stream_id in self.symbol_by_stream_id:  # Iterate through instruments
+            for channel in self.channels:  # Iterate through channels
+                ws.send(json.dumps({"type": "subscribe", "subscription": {"name": channel, "id": stream_id}}))  # Send subscription
+
+
+    def on_message(self, ws, message: str) -> None:
+        """
+        Stores the data of an incoming channel message.
+        
+        :param ws: WebSocket application instance
+        :param message: Raw message text
+        :return: None
+        """
+        
+        self.last_received = time.monotonic()  # Any message proves the connection is alive
+        
+        try:  # Attempt to decode message
+            payload = json_loads(message)  # Decode JSON message
+        except ValueError:  # Handle malformed messages
+            return  # Ignore malformed messages
+        
+        channel = payload.get("type")  # Get channel name
+        if channel == "pong":  # Verify if message is a ping reply
+            return  # Nothing to store for pongs
+        symbol = self.symbol_by_stream_id.get(payload.get("id"))  # Get symbol for the instrument
+        data = payload.get("data")  # Get message data
+        
+        if channel in self.channels and symbol is not None and data is not None:  # Verify if message is a subscribed data update
+            received_at = time.monotonic()  # Receive timestamp
+            self.latest[(channel, symbol)] = (received_at, data)  # Store data with receive timestamp
+            if channel == "ticker":  # Verify if message is a ticker update
+                try:  # Attempt to parse the last price once, on ingestion
+                    self.last_prices[symbol] = (received_at, float(data["last"]))  # Store parsed price with receive timestamp
+                except (KeyError, TypeError, ValueError):  # Handle missing or malformed price
+                    return  # Keep the previous price, nothing new to signal
+                self.ticker_events[symbol].set()  # Wake consumers waiting for a new price of this symbol
+
+
+    def reconnect(self) -> None:
+        """
+        Drops the current connection so the connection loop opens a fresh one (e.g., after stale data).
+        
+        :param: None
+        :return: None
+        """
+        
+        ws = self.ws  # Get current WebSocket application
+        if ws is not None:  # Verify if a connection exists
+            ws.close()  # Close it (the connection loop reconnects after the reconnect delay)
+
+
+    def is_stale(self, max_age: float) -> bool:
+        """
+        Verifies if the stream connected but has received nothing for longer than max_age.
+        
+        :param max_age: Maximum accepted seconds since the latest message
+        :return: True if connected and silent for longer than max_age, False otherwise (including while connecting)
+        """
+        
+        return self.connected and time.monotonic() - self.last_received > max_age  # Only an open, silent connection is stale
+
+
+    def wait_for_ticker(self, symbol: str, timeout: float) -> bool:
+        """
+        Blocks until a ticker update for the symbol arrives, the stream stops or the timeout expires.
+        The event is re-armed before returning, so the caller's following price read sees this update
+        and any update stored after that read sets the event again.
+        
+        :param symbol: Trading pair symbol (e.g., BTC-BRL)
+        :param timeout: Maximum seconds to wait
+        :return: True if woken by an update (or stop), False on timeout
+        """
+        
+        event = self.ticker_events[symbol]  # Get the symbol's update event
+        updated = event.wait(timeout)  # Wait for the next ticker update
+        if updated and not self.stop_event.is_set():  # Verify if woken by an update (keep the event set once stopped)
+            event.clear()  # Re-arm before the caller reads the price, never after a timeout
+        return updated  # Return whether an update arrived
+
+
+    def get_latest(self, channel: str, symbol: str, max_age: float) -> Optional[Dict]:
+        """
+        Returns the latest data for a channel and symbol if fresh enough.
+        
+        :param channel: Channel name (ticker or orderbook)
+        :param symbol: Trading pair symbol (e.g., BTC-BRL)
+        :param max_age: Maximum accepted data age in seconds
+        :return: Data dictionary or None if missing or stale
+        """
+        
+        entry = self.latest.get((channel, symbol))  # Get cached entry
+        if entry is None or time.monotonic() - entry[0] > max_age:  # Verify if entry exists and is fresh
+            return None  # Return None if missing or stale
+        return entry[1]  # Return cached data
+
+
+    def get_last_price_entry(self, symbol: str, max_age: float) -> Optional[Tuple[float, float]]:
+        """
+        Returns the latest streamed last price for a symbol with its receive time, if fresh enough.
+        
+        :param symbol: Trading pair symbol (e.g., BTC-BRL)
+        :param max_age: Maximum accepted price age in seconds
+        :return: Tuple of (monotonic receive time, last price) or None if missing or stale
+        """
+        
+        entry = self.last_prices.get(symbol)  # Get cached price entry
+        if entry is None or time.monotonic() - entry[0] > max_age:  # Verify if entry exists and is fresh
+            return None  # Return None if missing or stale
+        return entry  # Return receive time and parsed price
+
+
+    def get_last_price(self, symbol: str, max_age: float) -> Optional[float]:
+        """
+        Returns the latest streamed last price for a symbol if fresh enough.
+        
+        :param symbol: Trading pair symbol (e.g., BTC-BRL)
+        :param max_age: Maximum accepted price age in seconds
+        :return: Last price as float or None if missing or stale
+        """
+        
+        entry = self.get_last_price_entry(symbol, max_age)  # Get fresh price entry
+        return entry[1] if entry is not None else None  # Return parsed price
+
+
+    def get_ticker(self, symbol: str, max_age: float) -> Optional[Dict]:
+        """
+        Returns the latest ticker for a symbol if fresh enough.
+        
+        :param symbol: Trading pair symbol (e.g., BTC-BRL)
+        :param max_age: Maximum accepted data age in seconds
+        :return: Ticker dictionary or None if missing or stale
+        """
+        
+        return self.get_latest("ticker", symbol, max_age)  # Return latest ticker data
+
+
+    def get_orderbook(self, symbol: str, max_age: float) -> Optional[Dict]:
+        """
+        Returns the latest order book for a symbol if fresh enough.
+        
+        :param symbol: Trading pair symbol (e.g., BTC-BRL)
+        :param max_age: Maximum accepted data age in seconds
+        :return: Order book dictionary or None if missing or stale
+        """
+        
+        return self.get_latest("orderbook", symbol, max_age)  # Return latest order book data
+
+
+# Functions Definitions:
+
+
+def to_stream_id(symbol: str) -> str:
+    """
+    Converts a REST trading pair symbol to the WebSocket instrument ID.
+    
+    :param symbol: Trading pair symbol (e.g., BTC-BRL)
+    :return: WebSocket instrument ID (e.g., BRLBTC)
+    """
+    
+    base, _, quote = symbol.partition("-")  # Split base and quote currencies
+    return f"{quote}{base}"  # Return quote followed by base
+
+
+def create_market_data_stream(symbols: Iterable[str], url: str = WS_URL, reconnect_delay: float = RECONNECT_DELAY) -> MarketDataStream:
+    """
+    Factory function to create and start a MarketDataStream instance.
+    
+    :param symbols: Trading pair symbols to subscribe to (e.g., BTC-BRL)
+    :param url: WebSocket endpoint URL
+    :param reconnect_delay: Seconds to wait before reconnecting
+    :return: Started MarketDataStream instance
+    """
+    
+    stream = MarketDataStream(symbols, url=url, reconnect_delay=reconnect_delay)  # Create stream instance
+    stream.start()  # Start background connection
+    return stream  # Return started stream